@@ -4,17 +4,30 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 import uvicorn
+from contextlib import asynccontextmanager
 from infrastructure.config.settings import settings
 from fastapi import FastAPI
 from fastapi.responses import RedirectResponse
 from fastapi.middleware.cors import CORSMiddleware
 from infrastructure.adapters.input.valuation_router import router as valuation_router
 from infrastructure.adapters.input.discovery_router import router as discovery_router
+from infrastructure.adapters.input.dependencies import close_adapters
+from infrastructure.mappers.alphavantage_mapper import warn_if_pure_python_decimal
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Runs the startup environment checks and releases the adapters' pooled HTTP connections when the server shuts down.
+    """
+    warn_if_pure_python_decimal()
+    yield
+    await close_adapters()
 
 app = FastAPI(
     title="Equity Valuation Engine API",
     description="API for the Equity Valuation Engine, focused on Value Investing fundamentals and advanced analysis.",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Configure CORS
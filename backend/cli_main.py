@@ -14,9 +14,12 @@ from infrastructure.presentation.qualitative_valuation_adapter import Qualitativ
 from infrastructure.presentation.sector_valuation_adapter import SectorValuationAdapter
 from application.use_cases.analyse_earnings_report import EarningsReportUseCase
 from infrastructure.presentation.earnings_report_adapter import EarningsReportAdapter
+from infrastructure.mappers.alphavantage_mapper import warn_if_pure_python_decimal
 from infrastructure.config.settings import settings
 
 async def main():
+    warn_if_pure_python_decimal()
+    
     ticker = "META"
     years_of_history = 10
     pdf_path = os.path.join(os.path.dirname(__file__), "test_data", "Meta-03-31-2026-Exhibit-99-1_final.pdf")
@@ -41,14 +44,24 @@ async def main():
     print(f"FULL INVESTMENT DOSSIER: {ticker}")
     print(f"{'='*80}")
     
-    # Sector/Industry Analysis
-    await sector_controller.run(ticker)
-    # Qualitative Analysis
-    await qual_controller.run(ticker)
-    # Quantitative Analysis
-    await quant_controller.run(ticker, years=years_of_history)
-    # Earnings Report Analysis
-    await earnings_controller.run(ticker, pdf_path)
+    # The four analyses are independent and I/O-bound, so they run concurrently; the adapters' rate
+    # limiters still pace the upstream APIs. Each controller returns its rendered report, and the
+    # reports are written in the fixed dossier order regardless of which analysis finishes first.
+    try:
+        reports = await asyncio.gather(
+            # Sector/Industry Analysis
+            sector_controller.render(ticker),
+            # Qualitative Analysis
+            qual_controller.render(ticker),
+            # Quantitative Analysis
+            quant_controller.render(ticker, years=years_of_history),
+            # Earnings Report Analysis
+            earnings_controller.render(ticker, pdf_path)
+        )
+    finally:
+        await alpha_vantage_adapter.aclose()
+    sys.stdout.write("".join(reports))
+    sys.stdout.flush()
     
     print(f"{'='*80}")
     print("ANALYSIS COMPLETE")
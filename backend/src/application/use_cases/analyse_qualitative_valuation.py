@@ -3,15 +3,24 @@ from application.ports.llm_analysis_ports import QualitativeDataPort
 from application.ports.core_financial_ports import QuantitativeDataPort, OwnershipDataPort
 from application.dtos import TickerResult, QualitativeValuationResult
 from dataclasses import asdict
+from typing import Dict, List, Optional, Tuple
+import asyncio
 import dataclasses
 import datetime
 import logging
+import time
 
 class QualitativeValuationUseCase:
     """
     Service responsible for performing stock qualitative valuation analysis based on the provided stock data.
     This service takes in an entity Ticker, analyses the quality, moat and background of a business, and returns a DTO containing all information about the Qualitative data of the business.
     """
+    # The result embeds the live quote (price, market cap, today's change) and the shareholder list, so it is
+    # only reused as long as market data is elsewhere (the 300s GLOBAL_QUOTE TTL); the LLM answer itself
+    # stays cached on disk by the adapter for longer.
+    RESULT_CACHE_TTL = 300
+    RESULT_CACHE_SIZE = 256 # memoised analyses; the oldest entry is evicted first
+    
     def __init__(self, adapter: QualitativeDataPort, quant_adapter: QuantitativeDataPort, ownership_adapter: OwnershipDataPort, translator=None, filing_repository_port=None):
         """
         Initializes the QualitativeValuationUseCase with the GeminiAdapter for AI-driven analysis.
@@ -21,14 +30,50 @@ class QualitativeValuationUseCase:
         self.ownership_adapter = ownership_adapter
         self.translator = translator
         self.filing_repository_port = filing_repository_port
+        self._results: Dict[Tuple[str, str, Optional[str]], Tuple[float, QualitativeValuationResult]] = {}
         
     async def analyse_ticker(self, ticker_symbol: str, language: str = "en", period: str = None) -> QualitativeValuationResult:
         """
         Fetches the ticker information, such as business name, sector and industry
         
+        Results are memoised per (symbol, language, period) for RESULT_CACHE_TTL, so re-analysing a
+        business skips the market data, filing and LLM round-trips entirely.
+        
+        Args:
+            ticker_symbol (str): The stock ticker symbol to analyse.
+            language (str): Target language for the analysis
+            
+        Returns:
+            QualitativeValuationResult: a DTO containing all information about the Qualitative data of the business.
+        """
+        key = (ticker_symbol.upper(), language, period)
+        now = time.monotonic()
+        # Entries are kept in creation order, so the expired ones are always at the front
+        while self._results:
+            oldest = next(iter(self._results))
+            if now - self._results[oldest][0] < self.RESULT_CACHE_TTL:
+                break
+            del self._results[oldest]
+            
+        cached = self._results.get(key)
+        if cached is not None:
+            return cached[1]
+        
+        result = await self._analyse_ticker(ticker_symbol, language, period)
+        self._results.pop(key, None)
+        if len(self._results) >= self.RESULT_CACHE_SIZE:
+            del self._results[next(iter(self._results))]
+        self._results[key] = (time.monotonic(), result)
+        return result
+        
+    async def _analyse_ticker(self, ticker_symbol: str, language: str, period: Optional[str]) -> QualitativeValuationResult:
+        """
+        Builds the market and filing context for a ticker and runs the qualitative LLM analysis.
+        
         Args:
             ticker_symbol (str): The stock ticker symbol to analyse.
             language (str): Target language for the analysis
+            period (Optional[str]): Optional filing period used for the RAG context.
             
         Returns:
             QualitativeValuationResult: a DTO containing all information about the Qualitative data of the business.
@@ -165,4 +210,23 @@ class QualitativeValuationUseCase:
             **qual_data_dict
         )
             
-        return result_dto
\ No newline at end of file
+        return result_dto
+
+    async def analyse_tickers(self, ticker_symbols: List[str], language: str = "en", period: str = None) -> List[QualitativeValuationResult]:
+        """
+        Analyses several tickers concurrently, one qualitative report per symbol.
+
+        Each symbol keeps its own context, cache entry and schema validation, so the
+        LLM round-trips for the batch overlap instead of running back to back.
+
+        Args:
+            ticker_symbols (List[str]): The stock ticker symbols to analyse.
+            language (str): Target language for the analysis
+            period (str): Optional filing period used for the RAG context.
+
+        Returns:
+            List[QualitativeValuationResult]: One DTO per symbol, in the same order as ticker_symbols.
+        """
+        return list(await asyncio.gather(
+            *(self.analyse_ticker(symbol, language, period) for symbol in ticker_symbols)
+        ))
@@ -1,17 +1,95 @@
 from application.ports.core_financial_ports import QuantitativeDataPort
-from domain.entities import FinancialYear
+from domain.entities import FinancialYear, FinancialQuarter
 from application.dtos import TickerResult, MetricYearlyResult, MetricQuarterlyResult, MetricAnalysisResult, QuantitativeValuationResult
 from dataclasses import fields
+from operator import attrgetter
 import dataclasses
 from decimal import Decimal
-from typing import List
+from typing import Dict, List, Tuple
 import asyncio
+import heapq
+import numpy as np
+
+def cagr_batch(values: np.ndarray) -> np.ndarray:
+    """
+    Calculates the CAGR of every metric row of a (n_metrics, n_years) matrix with whole-array operations.
+    
+    Each row is ordered from most recent (column 0) to oldest (last column), mirroring calculate_cagr.
+    Missing values are encoded as NaN.
+    
+    Args:
+        values (np.ndarray): float64 matrix of metric values, one row per metric.
+        
+    Returns:
+        np.ndarray: The CAGR percentage per metric, or NaN where the calculation is not possible.
+    """
+    n_metrics, n_years = values.shape
+    if n_years < 2:
+        return np.full(n_metrics, np.nan)
+    
+    end_vals = values[:, 0]
+    begin_vals = values[:, n_years - 1]
+    
+    # NaN compares False everywhere, so missing values drop out with the zero and sign checks
+    valid = (begin_vals != 0.0) & (end_vals != 0.0) & ((begin_vals < 0.0) == (end_vals < 0.0))
+    valid &= ~(np.isnan(begin_vals) | np.isnan(end_vals))
+    
+    ratios = np.divide(end_vals, begin_vals, out=np.ones(n_metrics), where=valid)
+    result = (np.power(ratios, 1.0 / (n_years - 1)) - 1.0) * 100.0
+    result[~valid] = np.nan
+    return result
+
+# Relative distance from a rounding half-way point inside which float64 error can pick the wrong side
+_CAGR_TIE_TOLERANCE = 1e-9
+
+def cagr_to_decimal(cagr: float, values: List[Decimal]) -> Decimal | None:
+    """
+    Converts a cagr_batch result into the two-decimal CAGR that calculate_cagr returns for the same values.
+    
+    Away from a rounding tie the float result rounds the same way as the exact Decimal one. Close to a tie
+    (e.g. 100 -> 100.135) the float error can fall on either side, so the CAGR is recomputed in Decimal
+    from the original values and rounded half-even.
+    
+    Args:
+        cagr (float): The CAGR percentage computed by cagr_batch, or NaN.
+        values (List[Decimal]): The metric values of the row, ordered from newest to oldest.
+        
+    Returns:
+        Decimal | None: The CAGR percentage rounded to two decimal places, or None if it is not defined.
+    """
+    if np.isnan(cagr):
+        return None
+    scaled = cagr * 100.0
+    if abs(abs(scaled - np.trunc(scaled)) - 0.5) <= _CAGR_TIE_TOLERANCE * max(1.0, abs(scaled)):
+        return QuantitativeValuationUseCase.calculate_cagr(values)
+    return Decimal(f"{cagr:.2f}")
+
+# The analysed metrics and their display names only depend on the FinancialYear schema,
+# so they are resolved once at import time instead of on every valuation.
+_EXCLUDED_FIELDS = ("fiscal_date_ending", "year_end_price", "quarter_end_price")
+_RATIO_FIELDS = (
+    "total_equity", "gross_margin", "operating_margin", 
+    "net_margin", "roe", "roic", "debt_to_equity",
+    "market_cap", "pe_ratio", "pb_ratio", "ps_ratio", "free_cash_flow", "fcf_yield", "eps",
+    "current_ratio", "ev_to_ebitda", "historical_wacc", "debt_to_ebitda", "pfcf_ratio"
+)
+_METRICS_TO_ANALYSE = tuple(f.name for f in fields(FinancialYear) if f.name not in _EXCLUDED_FIELDS) + _RATIO_FIELDS
+_METRIC_NAMES = {metric: metric.replace("_", " ").title() for metric in _METRICS_TO_ANALYSE}
+_METRIC_GETTERS = tuple(attrgetter(metric) for metric in _METRICS_TO_ANALYSE)
+
+_ZERO = Decimal(0)
+
+def _period_sort_key(period: FinancialYear) -> str:
+    """Sort key for fiscal periods; TTM sorts after every dated period."""
+    return "9999-12-31" if period.fiscal_date_ending == "TTM" else period.fiscal_date_ending
 
 class QuantitativeValuationUseCase:
     """
     Service responsible for performing stock quantitative valuation analysis based on the provided stock data, including financial metrics across multiple fiscal years.
     This service takes in a List of Financial Years, analyses the financial metrics for a specified number of recent years, and returns a DTO containing all information about the Quantitative data of the business.
     """
+    ANALYSIS_CACHE_SIZE = 256 # memoised metric analyses; the oldest entry is evicted first
+    
     def __init__(self, adapter: QuantitativeDataPort):
         """
         Initializes the QuantitativeValuationUseCase with the QuantitativeDataPort to fetch fundamental business data.
@@ -20,6 +98,7 @@ class QuantitativeValuationUseCase:
             adapter (QuantitativeDataPort): The adapter for yearly and quarterly financial data.
         """
         self.adapter = adapter
+        self._analyses: Dict[tuple, Tuple[Dict[str, MetricAnalysisResult], Dict[str, List[MetricQuarterlyResult]]]] = {}
         
     async def evaluate_ticker(self, ticker_symbol: str, years: int = 5) -> QuantitativeValuationResult:
         """
@@ -46,6 +125,10 @@ class QuantitativeValuationUseCase:
             self.adapter.get_stock_quarterly_data(ticker_symbol)
         )
         if financial_years:
+            # Only the most recent `years` periods are analysed, so they are selected (newest first) before
+            # any per-period work. TTM is treated as the most recent date possible.
+            financial_years = heapq.nlargest(years, financial_years, key=_period_sort_key)
+            
             ttm_idx = next((i for i, y in enumerate(financial_years) if y.fiscal_date_ending == "TTM"), None)
             if ttm_idx is not None:
                 financial_years[ttm_idx] = dataclasses.replace(financial_years[ttm_idx], year_end_price=current_price_obj.amount)
@@ -56,21 +139,6 @@ class QuantitativeValuationUseCase:
             if financial_quarters:
                 financial_quarters = [dataclasses.replace(fq, beta=ticker_beta) for fq in financial_quarters]
             
-            # Enforce sorting: Newest first (Descending). TTM is treated as the most recent date possible.
-            financial_years.sort(key=lambda x: "9999-12-31" if x.fiscal_date_ending == "TTM" else x.fiscal_date_ending, reverse=True)
-            
-        all_fields = [f.name for f in fields(FinancialYear)]
-        excluded_fields = ["fiscal_date_ending", "year_end_price", "quarter_end_price"]
-        
-        ratio_fields = [
-            "total_equity", "gross_margin", "operating_margin", 
-            "net_margin", "roe", "roic", "debt_to_equity",
-            "market_cap", "pe_ratio", "pb_ratio", "ps_ratio", "free_cash_flow", "fcf_yield", "eps",
-            "current_ratio", "ev_to_ebitda", "historical_wacc", "debt_to_ebitda", "pfcf_ratio"
-        ]
-        
-        metrics_to_analyse = [f for f in all_fields if f not in excluded_fields] + ratio_fields
-        
         ticker_dto = TickerResult(
             symbol=ticker.symbol,
             name=ticker.name,
@@ -86,40 +154,90 @@ class QuantitativeValuationUseCase:
             regular_market_change_percent=ticker.regular_market_change_percent
         )
         
-        metrics_dtos = {}
-        for metric in metrics_to_analyse:
-            yearly_dtos = []
-            raw_values = []
-            
-            for fy in financial_years[:years]:
-                val = getattr(fy, metric)
-                yearly_dtos.append(MetricYearlyResult(date=fy.fiscal_date_ending, value=val))
-                raw_values.append(val)
-                
-            cagr = self.calculate_cagr(raw_values)
+        analysis_years = tuple(financial_years[:years]) if financial_years else ()
+        analysed_quarters = tuple(financial_quarters) if financial_quarters else ()
+        
+        # The periods are frozen (hashable) entities that already carry the injected beta and TTM price,
+        # so an unchanged set of periods maps to the same metric analysis.
+        key = (analysis_years, analysed_quarters)
+        analysis = self._analyses.get(key)
+        if analysis is None:
+            analysis = self._analyse_metrics(analysis_years, analysed_quarters)
+            if len(self._analyses) >= self.ANALYSIS_CACHE_SIZE:
+                del self._analyses[next(iter(self._analyses))]
+            self._analyses[key] = analysis
+        metrics_dtos, quarterly_metrics_dtos = analysis
+
+        return QuantitativeValuationResult.model_construct(
+            ticker=ticker_dto, 
+            metrics=metrics_dtos,
+            quarterly_metrics=quarterly_metrics_dtos
+        )
+    
+    def _analyse_metrics(
+        self, analysis_years: Tuple[FinancialYear, ...], financial_quarters: Tuple[FinancialQuarter, ...]
+    ) -> Tuple[Dict[str, MetricAnalysisResult], Dict[str, List[MetricQuarterlyResult]]]:
+        """
+        Builds the per-metric yearly analysis (values and CAGR) and the quarterly series.
+        
+        Args:
+            analysis_years (Tuple[FinancialYear, ...]): The analysed fiscal years, newest first.
+            financial_quarters (Tuple[FinancialQuarter, ...]): The fiscal quarters to expose per metric.
             
-            formatted_name = metric.replace("_", " ").title()
+        Returns:
+            Tuple[Dict[str, MetricAnalysisResult], Dict[str, List[MetricQuarterlyResult]]]: The yearly metric
+            analyses and the quarterly metric series, both keyed by metric field name.
+        """
+        raw_values = [list(map(get_value, analysis_years)) for get_value in _METRIC_GETTERS]
+        
+        # One CAGR kernel invocation per stock instead of one Decimal calculation per metric
+        # NumPy converts the Decimal cells (and None as NaN) while filling the matrix, without per-row float lists
+        values = np.array(raw_values, dtype=np.float64).reshape(len(_METRICS_TO_ANALYSE), len(analysis_years))
+        cagrs = cagr_batch(values)
+        
+        # Period dates do not depend on the metric, so they are read once instead of once per metric
+        year_dates = [fy.fiscal_date_ending for fy in analysis_years]
+        
+        # The metric DTOs wrap values produced by the domain entities (str dates, Decimal | None values),
+        # so they are built with model_construct instead of re-validating every field of every period.
+        metrics_dtos = {}
+        for metric, row, cagr in zip(_METRICS_TO_ANALYSE, raw_values, cagrs):
+            yearly_dtos = [MetricYearlyResult.model_construct(date=date, value=val) for date, val in zip(year_dates, row)]
             
-            metrics_dtos[metric] = MetricAnalysisResult(
-                metric_name=formatted_name,
+            metrics_dtos[metric] = MetricAnalysisResult.model_construct(
+                metric_name=_METRIC_NAMES[metric],
                 yearly_data=yearly_dtos,
-                cagr=cagr
+                cagr=cagr_to_decimal(cagr, row)
             )
 
         quarterly_metrics_dtos = {}
         if financial_quarters:
-            for metric in metrics_to_analyse:
-                quarterly_dtos = []
-                for fq in financial_quarters:
-                    val = getattr(fq, metric)
-                    quarterly_dtos.append(MetricQuarterlyResult(date=fq.fiscal_date_ending, value=val))
-                quarterly_metrics_dtos[metric] = quarterly_dtos
+            quarter_dates = [fq.fiscal_date_ending for fq in financial_quarters]
+            quarterly_metrics_dtos = {
+                metric: [MetricQuarterlyResult.model_construct(date=date, value=get_value(fq)) for date, fq in zip(quarter_dates, financial_quarters)]
+                for metric, get_value in zip(_METRICS_TO_ANALYSE, _METRIC_GETTERS)
+            }
 
-        return QuantitativeValuationResult(
-            ticker=ticker_dto, 
-            metrics=metrics_dtos,
-            quarterly_metrics=quarterly_metrics_dtos
-        )
+        return metrics_dtos, quarterly_metrics_dtos
+    
+    async def evaluate_tickers(self, ticker_symbols: List[str], years: int = 5) -> List[QuantitativeValuationResult]:
+        """
+        Evaluates several tickers concurrently, one quantitative report per symbol.
+
+        The adapters are async, so the network fetches for the whole batch overlap and the
+        wall-clock time approaches that of the slowest ticker instead of the sum of all of them.
+
+        Args:
+            ticker_symbols (List[str]): The stock market ticker symbols to evaluate.
+            years (int): The number of recent fiscal years to include in the trend analysis. 
+                         Defaults to 5.
+
+        Returns:
+            List[QuantitativeValuationResult]: One DTO per symbol, in the same order as ticker_symbols.
+        """
+        return list(await asyncio.gather(
+            *(self.evaluate_ticker(symbol, years) for symbol in ticker_symbols)
+        ))
     
     @staticmethod
     def calculate_cagr(values: List[Decimal]) -> Decimal | None:
@@ -146,11 +264,11 @@ class QuantitativeValuationUseCase:
         if begin_val is None or end_val is None:
             return None
         
-        if begin_val == Decimal("0") or end_val == Decimal("0"):
+        if begin_val == _ZERO or end_val == _ZERO:
             return None
         
         # Cannot calculate standard CAGR if signs are different
-        if (begin_val < Decimal("0") and end_val > Decimal("0")) or (begin_val > Decimal("0") and end_val < Decimal("0")):
+        if (begin_val < _ZERO and end_val > _ZERO) or (begin_val > _ZERO and end_val < _ZERO):
             return None
         
         periods = len(values) - 1
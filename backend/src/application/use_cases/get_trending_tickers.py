@@ -33,8 +33,10 @@ class GetTrendingTickersUseCase:
         else:
             raise ValueError("Either sector_key or industry_key must be provided")
             
+        # The port already returns typed values (str symbol/name, Optional[str] rating, Optional[float] weight),
+        # so the per-row pydantic validation is skipped.
         dto_results = [
-            TrendingTickerDTO(
+            TrendingTickerDTO.model_construct(
                 symbol=r["symbol"],
                 name=r["name"],
                 rating=r.get("rating"),
@@ -43,4 +45,4 @@ class GetTrendingTickersUseCase:
             for r in results
         ]
         
-        return TrendingTickerResult(results=dto_results)
+        return TrendingTickerResult.model_construct(results=dto_results)
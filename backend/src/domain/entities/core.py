@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional
 from domain.exceptions.exceptions import DomainValidationError
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Price:
     """
     Represents the current price of a stock, including the amount and currency.
@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional
 from domain.exceptions.exceptions import DomainValidationError
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaseFinancialPeriod:
     """
     Base class representing the financial data for a specific fiscal period.
@@ -265,7 +265,7 @@ class BaseFinancialPeriod:
             return None
         return round(self.net_income / self.shares_outstanding, 2)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FinancialYear(BaseFinancialPeriod):
     """
     Represents the financial data for a specific fiscal year.
@@ -279,7 +279,7 @@ class FinancialYear(BaseFinancialPeriod):
     def period_end_price(self) -> Decimal:
         return self.year_end_price
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FinancialQuarter(BaseFinancialPeriod):
     """
     Represents the financial data for a specific fiscal quarter.
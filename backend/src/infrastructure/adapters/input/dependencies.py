@@ -12,9 +12,9 @@ from infrastructure.adapters.output.alpha_vantage_adapter import AlphaVantageAda
 from infrastructure.adapters.output.yfinance_adapter import YfinanceAdapter
 from infrastructure.adapters.output.gemini_adapter import GeminiAdapter
 from infrastructure.adapters.output.sec_edgar_adapter import SECAdapter
-from infrastructure.adapters.output.sec_edgar_adapter import SECAdapter
 from infrastructure.config.settings import settings
 from typing import Union
+from functools import lru_cache
 from application.ports.core_financial_ports import QuantitativeDataPort, PerformanceDataPort, OwnershipDataPort
 from application.ports.llm_analysis_ports import SectorIndustrialDataPort, EarningsReportPort, QualitativeDataPort
 from application.ports.discovery_ports import SearchDataPort, TrendingDataPort
@@ -37,6 +37,12 @@ _gemini_adapter = ResilientLLMAdapter(base_adapter=_gemini_adapter_raw)
 
 _sec_adapter = SECAdapter()
 
+async def close_adapters():
+    """Closes the pooled HTTP clients held by the shared adapters; called on application shutdown."""
+    await _alpha_adapter.aclose()
+    await _yfinance_adapter.aclose()
+    await _gemini_adapter_raw.aclose()
+
 def get_translator() -> GroqTranslatorAdapter:
     """Provides the translator adapter instance."""
     return _translator
@@ -109,7 +115,12 @@ def get_quantitative_use_case(
 ) -> QuantitativeValuationUseCase:
     """
     Builds and provides the Quantitative Valuation Use Case via Dependency Injection.
+    The instance is reused across requests for the same adapter so its analysis cache survives between calls.
     """
+    return _build_quantitative_use_case(quant_adapter)
+
+@lru_cache(maxsize=None)
+def _build_quantitative_use_case(quant_adapter) -> QuantitativeValuationUseCase:
     return QuantitativeValuationUseCase(adapter=quant_adapter)
 
 def get_qualitative_use_case(
@@ -120,7 +131,12 @@ def get_qualitative_use_case(
 ) -> QualitativeValuationUseCase:
     """
     Builds and provides the Qualitative Valuation Use Case via Dependency Injection.
+    The instance is reused across requests for the same adapters so its result cache survives between calls.
     """
+    return _build_qualitative_use_case(quant_adapter, llm_adapter, translator, filing_repository_port)
+
+@lru_cache(maxsize=None)
+def _build_qualitative_use_case(quant_adapter, llm_adapter, translator, filing_repository_port) -> QualitativeValuationUseCase:
     return QualitativeValuationUseCase(
         adapter=llm_adapter, 
         quant_adapter=quant_adapter, 
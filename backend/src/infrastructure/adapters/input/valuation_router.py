@@ -42,7 +42,8 @@ from application.dtos import (
     QualitativeValuationResult,
     SectorIndustrialValuationResult,
     TickerSearchResult,
-    LocalFilingListResult
+    LocalFilingListResult,
+    SectorPerformanceResult
 )
 
 def handle_domain_error(e: Exception):
@@ -231,7 +232,7 @@ async def analyse_sector(
     except Exception as e:
         handle_domain_error(e)
 
-@router.get("/sector-performance/{ticker}")
+@router.get("/sector-performance/{ticker}", response_model=SectorPerformanceResult)
 async def get_sector_performance(
     ticker: str,
     use_case: GetSectorPerformanceUseCase = Depends(get_sector_performance_use_case)
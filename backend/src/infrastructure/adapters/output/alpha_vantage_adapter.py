@@ -1,27 +1,43 @@
 import os
 import time
-import json
+import orjson
 import asyncio
 import httpx
 import yfinance as yf
 import pandas as pd
 from decimal import Decimal
-from typing import Dict, Optional, List
+from typing import Callable, Dict, Optional, List, Tuple
 from dotenv import load_dotenv
 
 from domain.entities import Price, FinancialYear, FinancialQuarter, Ticker
 from application.ports.core_financial_ports import QuantitativeDataPort, OwnershipDataPort
 from application.exceptions.exceptions import TickerNotFoundError, RateLimitExceededError, ConfigurationError, ExternalServiceError
 from infrastructure.mappers.alphavantage_mapper import map_to_financial_years, map_to_financial_quarters
+from infrastructure.utils.http_utils import LoopBound, LoopBoundAsyncClient
 
 load_dotenv()
 
+# Top-level keys Alpha Vantage uses to report throttling and errors instead of an HTTP status.
+_SPEED_LIMIT_KEY, _DAILY_LIMIT_KEY, _API_ERROR_KEY = "Information", "Note", "Error Message"
+_ERROR_KEYS = frozenset((_SPEED_LIMIT_KEY, _DAILY_LIMIT_KEY, _API_ERROR_KEY))
+
 class AlphaVantageAdapter(QuantitativeDataPort, OwnershipDataPort):
     """
     Adapter for fetching stock data from the Alpha Vantage API. Implements the QuantitativeDataPort interface.
     This adapter handles both current price and fundamental financial data retrieval, with built-in caching and error handling.
     """
     BASE_URL = "https://www.alphavantage.co/query"
+    MIN_REQUEST_INTERVAL = 1.5 # seconds between network calls (free tier QPS cap)
+
+    # Cache lifetime per API function: statements change at most quarterly, quotes every minute.
+    DEFAULT_CACHE_TTL = 86400 # 24 hours
+    CACHE_TTL_BY_FUNCTION = {
+        "GLOBAL_QUOTE": 300,
+        "INCOME_STATEMENT": 7 * 86400,
+        "BALANCE_SHEET": 7 * 86400,
+        "CASH_FLOW": 7 * 86400,
+    }
+    MAPPED_CACHE_SIZE = 256 # memoised mapped report series; the oldest entry is evicted first
 
     def __init__(self, api_key: Optional[str] = None, client: Optional[httpx.AsyncClient] = None):
         """
@@ -35,12 +51,59 @@ class AlphaVantageAdapter(QuantitativeDataPort, OwnershipDataPort):
         
         self.api_key = api_key.strip()
         self.client = client
+        # Keeping one pooled client alive lets consecutive calls reuse warm keep-alive connections
+        # instead of paying a new TCP and TLS handshake per request.
+        self._pooled_client = LoopBoundAsyncClient(
+            lambda: httpx.AsyncClient(limits=httpx.Limits(max_connections=10, max_keepalive_connections=10))
+        )
+        # An asyncio.Lock binds to the loop it is first contended in, so one lock is kept per event loop
+        self._rate_lock = LoopBound(asyncio.Lock)
+        self._last_call_ts = 0.0
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+        self._mapped_reports: Dict[Tuple[str, str], Tuple[float, list]] = {}
 
         base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
         self.cache_dir = os.path.join(base_dir, '.alpha_vantage_cache')
         os.makedirs(self.cache_dir, exist_ok=True)
 
+    async def aclose(self):
+        """
+        Closes the adapter's pooled HTTP client. An injected client is owned by the caller and left open.
+        """
+        await self._pooled_client.aclose()
+
+    async def _throttle(self):
+        """
+        Waits until MIN_REQUEST_INTERVAL has elapsed since the previous network call.
+        Concurrent callers queue on a lock, so the rate limit holds across every in-flight request.
+        """
+        async with self._rate_lock.get():
+            wait = self._last_call_ts + self.MIN_REQUEST_INTERVAL - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_call_ts = time.monotonic()
+
     async def _get_data(self, function: str, symbol: str) -> Dict:
+        """
+        Fetches data for a given function and stock symbol, sharing a single in-flight request between
+        concurrent callers (e.g. the annual and quarterly fetches both need INCOME_STATEMENT).
+        
+        Args:
+            function (str): The Alpha Vantage API function to call (e.g., "OVERVIEW", "INCOME_STATEMENT").
+            symbol (str): The stock ticker symbol to fetch data for.
+            
+        Returns:
+            dict: The JSON response from the Alpha Vantage API as a dictionary.
+        """
+        key = (function, symbol.upper())
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_data(function, symbol))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_data(self, function: str, symbol: str) -> Dict:
         """
         Internal method to fetch data from the Alpha Vantage API for a given function and stock symbol.
         Handles rate limiting, caching, and API errors gracefully.
@@ -57,10 +120,10 @@ class AlphaVantageAdapter(QuantitativeDataPort, OwnershipDataPort):
 
         if os.path.exists(cache_path):
             file_age_seconds = time.time() - os.path.getmtime(cache_path)
-            if file_age_seconds < 86400: # 24 hours
+            if file_age_seconds < self.CACHE_TTL_BY_FUNCTION.get(function, self.DEFAULT_CACHE_TTL):
                 try:
-                    with open(cache_path, 'r', encoding='utf-8') as f:
-                        return json.load(f)
+                    with open(cache_path, 'rb') as f:
+                        return orjson.loads(f.read())
                 except Exception:
                     pass
 
@@ -70,31 +133,28 @@ class AlphaVantageAdapter(QuantitativeDataPort, OwnershipDataPort):
             "apikey": self.api_key
         }
         try:
-            await asyncio.sleep(1.5)
+            await self._throttle()
             
-            if self.client:
-                response = await self.client.get(self.BASE_URL, params=params, timeout=15)
-            else:
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(self.BASE_URL, params=params, timeout=15)
+            client = self.client or self._pooled_client.get()
+            response = await client.get(self.BASE_URL, params=params, timeout=15)
             response.raise_for_status()
         except httpx.HTTPError as e: 
             raise ExternalServiceError(f"Connection Error: {e}")
         else:
-            data = response.json()
-            
-            if "Information" in data:
-                raise RateLimitExceededError(f"Rate Limit (Speed): {data['Information']}")
+            data = orjson.loads(response.content)
             
-            if "Note" in data:
-                 raise RateLimitExceededError("Rate Limit (Daily): 25 requests/day reached.")
-                 
-            if "Error Message" in data:
-                raise TickerNotFoundError(f"API Error: {data['Error Message']}")
+            if data.keys() & _ERROR_KEYS:
+                if _SPEED_LIMIT_KEY in data:
+                    raise RateLimitExceededError(f"Rate Limit (Speed): {data[_SPEED_LIMIT_KEY]}")
+                
+                if _DAILY_LIMIT_KEY in data:
+                     raise RateLimitExceededError("Rate Limit (Daily): 25 requests/day reached.")
+                     
+                raise TickerNotFoundError(f"API Error: {data[_API_ERROR_KEY]}")
             
             try:
-                with open(cache_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=4)
+                with open(cache_path, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             except Exception:
                 pass
                 
@@ -151,6 +211,51 @@ class AlphaVantageAdapter(QuantitativeDataPort, OwnershipDataPort):
         return historical_prices
         
 
+    async def _get_mapped_reports(self, symbol: str, report_key: str, mapper: Callable[..., list]) -> list:
+        """
+        Fetches the three statements and monthly prices, and maps one report series to domain entities.
+        The mapped entities are immutable, so they are memoised per symbol for the lifetime of the
+        shortest-lived input (the 24h price cache) and re-runs skip the Decimal parsing entirely.
+        
+        Args:
+            symbol (str): The stock ticker symbol to fetch fundamental data for.
+            report_key (str): Either "annualReports" or "quarterlyReports".
+            mapper (Callable): Mapper merging the three statements into domain entities.
+            
+        Returns:
+            list: The mapped entities, shared with the memo (callers must copy before mutating).
+        """
+        key = (symbol.upper(), report_key)
+        now = time.monotonic()
+        # Entries are kept in creation order, so the expired ones are always at the front
+        while self._mapped_reports:
+            oldest = next(iter(self._mapped_reports))
+            if now - self._mapped_reports[oldest][0] < self.DEFAULT_CACHE_TTL:
+                break
+            del self._mapped_reports[oldest]
+            
+        cached = self._mapped_reports.get(key)
+        if cached is not None:
+            return cached[1]
+
+        income_stmt, balance_sheet, cash_flow, historical_prices = await asyncio.gather(
+            self._get_data("INCOME_STATEMENT", symbol),
+            self._get_data("BALANCE_SHEET", symbol),
+            self._get_data("CASH_FLOW", symbol),
+            self.get_historical_prices(symbol)
+        )
+
+        income_data = income_stmt.get(report_key, [])
+        balance_data = balance_sheet.get(report_key, [])
+        cash_data = cash_flow.get(report_key, [])
+        
+        reports = mapper(income_data, balance_data, cash_data, historical_prices)
+        self._mapped_reports.pop(key, None)
+        if len(self._mapped_reports) >= self.MAPPED_CACHE_SIZE:
+            del self._mapped_reports[next(iter(self._mapped_reports))]
+        self._mapped_reports[key] = (time.monotonic(), reports)
+        return reports
+
     async def get_stock_fundamental_data(self, symbol: str) -> List[FinancialYear]:
         """
         Fetches the fundamental financial data for a given stock ticker symbol from the Alpha Vantage API.
@@ -162,18 +267,8 @@ class AlphaVantageAdapter(QuantitativeDataPort, OwnershipDataPort):
         Returns:
             List[FinancialYear]: List containing the fundamental stock data for each Financial Year.
         """
-        income_stmt = await self._get_data("INCOME_STATEMENT", symbol)
-        balance_sheet = await self._get_data("BALANCE_SHEET", symbol)
-        cash_flow = await self._get_data("CASH_FLOW", symbol)
-
-        income_data = income_stmt.get("annualReports", [])
-        balance_data = balance_sheet.get("annualReports", [])
-        cash_data = cash_flow.get("annualReports", [])
-
-        historical_prices = await self.get_historical_prices(symbol)
-        
-        financial_years = map_to_financial_years(income_data, balance_data, cash_data, historical_prices)
-        return financial_years
+        financial_years = await self._get_mapped_reports(symbol, "annualReports", map_to_financial_years)
+        return list(financial_years)
         
     async def get_ticker_info(self, symbol: str) -> Ticker:
         """
@@ -269,15 +364,5 @@ class AlphaVantageAdapter(QuantitativeDataPort, OwnershipDataPort):
         Returns:
             List[FinancialQuarter]: List containing the fundamental stock data for each Financial Quarter.
         """
-        income_stmt = await self._get_data("INCOME_STATEMENT", symbol)
-        balance_sheet = await self._get_data("BALANCE_SHEET", symbol)
-        cash_flow = await self._get_data("CASH_FLOW", symbol)
-
-        income_data = income_stmt.get("quarterlyReports", [])
-        balance_data = balance_sheet.get("quarterlyReports", [])
-        cash_data = cash_flow.get("quarterlyReports", [])
-
-        historical_prices = await self.get_historical_prices(symbol)
-        
-        financial_quarters = map_to_financial_quarters(income_data, balance_data, cash_data, historical_prices)
+        financial_quarters = await self._get_mapped_reports(symbol, "quarterlyReports", map_to_financial_quarters)
         return financial_quarters[:5]
\ No newline at end of file
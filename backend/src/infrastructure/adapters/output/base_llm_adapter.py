@@ -21,56 +21,8 @@ from infrastructure.utils.llm_utils import extract_json_from_response
 
 T = TypeVar('T', bound=BaseModel)
 
-class BaseLLMAdapter(SectorIndustrialDataPort, EarningsReportPort, QualitativeDataPort, IntrinsicValueCalculationPort, ABC):
-    """
-    Abstract Base Class for LLM Adapters to enforce DRY principles.
-    Implements generic caching, schema validation, entity mapping, and translation logic.
-    Subclasses only need to implement the actual LLM API calls.
-    """
-    
-    def __init__(self, translator: Optional[TranslationPort] = None):
-        self.translator = translator
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
-        self.cache_dir = os.path.join(base_dir, '.llm_cache')
-        os.makedirs(self.cache_dir, exist_ok=True)
-
-    @abstractmethod
-    async def _generate_company_profile(self, prompt: str, schema: Type[T]) -> dict:
-        """Call the LLM API to generate the company profile JSON."""
-        pass
-
-    @abstractmethod
-    async def _generate_industry_dynamics(self, prompt: str, schema: Type[T]) -> dict:
-        """Call the LLM API to generate the industry dynamics JSON."""
-        pass
-
-    @abstractmethod
-    async def _generate_earnings_report(self, prompt: str, pdf_file_path: str, schema: Type[T]) -> dict:
-        """Call the LLM API to analyze an earnings report PDF."""
-        pass
-
-    @abstractmethod
-    async def _generate_dcf_assumptions(self, prompt: str, schema: Type[T]) -> dict:
-        """Call the LLM API to generate DCF assumptions."""
-        pass
-
-    def _get_cached_data(self, cache_path: str) -> Optional[dict]:
-        if os.path.exists(cache_path) and time.time() - os.path.getmtime(cache_path) < 86400:
-            try:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception:
-                pass
-        return None
-
-    def _set_cached_data(self, cache_path: str, data: dict):
-        with open(cache_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
-
-    async def analyse_company(self, symbol: str, language: str = "en", context: str = "") -> CompanyProfile:
-        context_prompt = f"\n\nREAL-WORLD CONTEXT (USE THIS AS ABSOLUTE TRUTH):\n{context}\n" if context else ""
-        
-        prompt = f"""
+# Prompt templates are rendered with str.format, so literal braces in the JSON examples are doubled.
+_COMPANY_PROFILE_PROMPT = """
         Act as a Senior Equity Research Analyst specializing in Fundamental Analysis. 
         Your goal is to provide a deep qualitative assessment for the company: {symbol}.{context_prompt}
 
@@ -157,69 +109,7 @@ class BaseLLMAdapter(SectorIndustrialDataPort, EarningsReportPort, QualitativeDa
         Do not include any markdown formatting outside the JSON, preamble, or conversational text. Return only the raw JSON.
         """
 
-        cache_filename = f"company_{symbol.upper()}_{language}.json"
-        target_dir = os.path.join(self.cache_dir, symbol.upper(), "analysis")
-        os.makedirs(target_dir, exist_ok=True)
-        cache_path = os.path.join(target_dir, cache_filename)
-        cache_filename_en = f"company_{symbol.upper()}_en.json"
-        cache_path_en = os.path.join(target_dir, cache_filename_en)
-        
-        data = self._get_cached_data(cache_path)
-        if not data:
-            data_en = self._get_cached_data(cache_path_en)
-            if not data_en:
-                data_en = await self._generate_company_profile(prompt, CompanyProfileSchema)
-                try:
-                    CompanyProfileSchema(**data_en)
-                except ValidationError as ve:
-                    raise LLMParsingError(f"LLM returned invalid JSON structure: {ve}")
-                self._set_cached_data(cache_path_en, data_en)
-            
-            if language != "en" and self.translator:
-                data = await self.translator.translate_json(data_en, language)
-            else:
-                data = data_en
-                
-            try:
-                CompanyProfileSchema(**data)
-            except ValidationError as ve:
-                raise LLMParsingError(f"Translator returned invalid JSON structure: {ve}")
-            self._set_cached_data(cache_path, data)
-
-        if "sources" in data and isinstance(data["sources"], dict):
-            new_sources = []
-            for k, v in data["sources"].items():
-                v["citation_id"] = str(k)
-                new_sources.append(v)
-            data["sources"] = new_sources
-
-        schema_instance = CompanyProfileSchema(**data)
-        
-        return CompanyProfile(
-            business_description="", # Injected later by UseCase
-            company_history=schema_instance.company_history,
-            key_executives=[{"name": e.name, "title": e.title, "ownership": float(e.ownership) if e.ownership is not None else None} for e in schema_instance.key_executives],
-            revenue_model=schema_instance.revenue_model,
-            strategy=schema_instance.strategy,
-            products_services={p.name: p.description for p in schema_instance.products_services},
-            competitive_advantage=schema_instance.competitive_advantage,
-            competitors=[{"name": c.name, "ticker": c.ticker, "overlap": c.overlap} for c in schema_instance.competitors],
-            management_insights=schema_instance.management_insights,
-            risk_factors={r.title: r.description for r in schema_instance.risk_factors},
-            historical_context_crises=schema_instance.historical_context_crises,
-            moat_trajectory_status=schema_instance.moat_trajectory_status,
-            moat_trajectory_description=schema_instance.moat_trajectory_description,
-            moat_sources=MoatSources(**schema_instance.moat_sources.model_dump()),
-            quality_pillars=QualityPillars(**schema_instance.quality_pillars.model_dump()),
-            capital_allocation_strategy=schema_instance.capital_allocation_strategy,
-            near_term_catalysts=[NearTermCatalyst(event=c.event, impact=c.impact) for c in schema_instance.near_term_catalysts],
-            sources={s.citation_id: EntitySourceInfo(url=s.url, title=s.title) for s in schema_instance.sources}
-        )
-
-    async def analyse_industry(self, sector: str, industry: str, language: str = "en", ticker: str = "", context: str = "") -> IndustrySectorDynamics:
-        context_prompt = f"\n\nREAL-WORLD CONTEXT (USE THIS AS ABSOLUTE TRUTH):\n{context}\n" if context else ""
-
-        prompt = f"""
+_INDUSTRY_DYNAMICS_PROMPT = """
         Act as a Senior Equity Research Analyst and Industry Strategist. 
         Perform a comprehensive fundamental analysis of the following market from the perspective of {ticker}:
         SECTOR: {sector}
@@ -270,10 +160,209 @@ class BaseLLMAdapter(SectorIndustrialDataPort, EarningsReportPort, QualitativeDa
         CRITICAL: YOU MUST INCLUDE ALL FIELDS IN THE OUTPUT. DO NOT OMIT 'interest_rate_exposure' or 'sources'. 
         Do not include markdown headers (like ```json), intro text, or conclusions. Return only raw JSON.
         """
+
+_EARNINGS_REPORT_PROMPT = """
+        You are a Senior Equity Analyst focused on long-term value investing. I am providing the full text of an Earnings Report for the company "{symbol}". Ignore short-term stock reactions and Wall Street consensus. Focus exclusively on underlying business fundamentals.{focus_instruction}
+
+        Perform a deep-dive analysis and return ONLY a structured JSON object. Do not include markdown formatting, code blocks, or conversational text.
+        Language: Generate ALL analysis text strictly in English. The JSON keys must remain in English as defined by the schema.
+
+        CRITICAL MATHEMATICAL RULES:
+        - For margins, output as whole percentages (e.g. 66.3 for 66.3%) and NOT as decimals (e.g. 0.663).
+        - ALWAYS output absolute monetary amounts strictly in BILLIONS. For example, 500 million must be written as 0.5. 17.6 billion must be written as 17.6. NEVER output raw large numbers.
+        - If a metric is fundamentally not applicable to the business model (like gross margin for a bank), output null.
+
+        CRITICAL TEMPORAL SCOPE:
+        - If the document is a quarterly report (10-Q), you MUST extract financial figures (Revenue, Margins, Cash Flows, CapEx) exclusively from the isolated 'Three Months Ended' column. NEVER extract the 'Six Months Ended', 'Nine Months Ended' or 'Year-to-Date' cumulative columns.
+        - If the document is an annual report (10-K), extract the full fiscal year figures.
+
+        Extract and synthesize the following fields EXACTLY as named.
+
+        1. period_end_date: (String) The end date of the fiscal period strictly in 'YYYY-MM-DD' format.
+        2. core_performance: (Object) Extract Adjusted (Non-GAAP) Revenue, Adjusted EPS, Adjusted Gross Margin, Adjusted Operating Margin, Adjusted Net Margin, and Free Cash Flow. Free Cash Flow MUST be calculated as 'Net Cash from Operations' minus 'CapEx' (Additions to property and equipment). For each metric, return an object with a single float field: 'amount'. Do NOT include any growth or YoY calculations — those are computed externally from verified data.
+        3. capital_allocation: (Object) Detail exact amounts (as floats, in billions) spent on 'share_buybacks', 'dividends', and 'capex_rd'. Also provide an 'infrastructure_assessment' string containing a full 2-3 sentence paragraph assessing the "why" behind the CapEx. You MUST extract specific hardware names, exact geographic locations of new facilities, specific project names, or exact financial sub-allocations if mentioned. Assess whether this CapEx cycle appears Defensive or Offensive. Explicitly IGNORE generic corporate jargon like "meeting customer needs" or "investing for the future".
+        4. forward_guidance: (String) Detailed 2-3 sentence analysis of management's forward-looking projections and guidance.
+        5. moat_trajectory_status: (String) Exactly "EXPANDING", "STABLE", or "SHRINKING".
+        5b. moat_trajectory_description: (String) Detailed 2-3 sentence analysis of the company's competitive advantage trajectory.
+        6. risk_deconstruction: (Object) Separate headwinds into two string lists (arrays of strings): 'macro_risks' (external) and 'internal_risks' (execution/product). Each individual risk must be a separate string element in the array. You MUST include numerical citations directly inside each string.
+        7. bottom_line: (String) A brutal, concise summary answering: Did the underlying business execute well, or are structural cracks forming?
+        8. sources: (List of Objects) You MUST provide inline numerical citations (e.g. [1], [2]) directly within your narrative text for fields like 'infrastructure_assessment', 'forward_guidance', 'moat_trajectory_description', 'risk_deconstruction', and 'bottom_line'. Then, in this 'sources' array, return a list of objects each containing 'citation_number' (integer) and 'source_text' (string). 
+        CRITICAL: The 'source_text' MUST be the exact raw quote or sentence from the document that proves your claim (e.g. "Cloud revenue grew 24% driven by AI workload demand"). DO NOT just provide page numbers or section titles. Citations must be strictly sequential (1, 2, 3...) with no skipped numbers.
+
+        QUALITY EXAMPLES (follow this tone and depth):
+        GOOD bottom_line: "Alphabet executed strongly: Search revenue grew 12% YoY driven by AI Overviews adoption, Cloud crossed the $12B annualized run-rate with 28% margins, and the $70B buyback signals management's confidence in sustained free cash flow generation [1]. The key risk is a potential deceleration in ad spend if macro conditions deteriorate [2]."
+        BAD bottom_line: "The company did well this quarter and beat expectations."
+        GOOD infrastructure_assessment: "CapEx surged to $30.8B, aggressively allocated to scaling Azure's AI infrastructure. Management is securing scarce GPU supply and building next-gen liquid-cooled datacenters, signaling an offensive land-grab in AI compute. This massive capital intensity will compress near-term operating margins but is designed to lock in long-term enterprise AI workloads."
+        BAD infrastructure_assessment: "The company is spending more on datacenters to meet growing AI demand and serve customers better."
+        """
+
+_DCF_ASSUMPTIONS_PROMPT = """
+        You are a top-tier Wall Street Financial Analyst specializing in Discounted Cash Flow (DCF) valuation and competitive moat assessment.
+        Your task is to deduce the most realistic future growth assumptions for {ticker} based on its historical performance, business model resilience, and macroeconomic context.
+
+        CRITICAL RULES:
+        1. DO NOT calculate the intrinsic value. Your ONLY job is to provide the growth rates, WACC, and terminal growth rate. The mathematical calculation will be handled by our deterministic backend engine.
+        2. Provide your assumptions for three scenarios: Bear (Pessimistic), Fair (Base Case), and Bull (Optimistic).
+        3. Provide a clear, sharp, and highly analytical justification (1-2 paragraphs) for why you chose these specific rates for each scenario.
+        4. Always respond strictly in English and format your response matching the provided JSON schema. All rates MUST be expressed as decimals (e.g. 15% is 0.15).
+
+        [CONTEXT INJECTED BY US]
+        COMPANY PROFILE & QUALITATIVE MOAT:
+        {company_profile_json}
+
+        QUANTITATIVE METRICS (FCF HISTORY & MARGINS):
+        {quant_data_json}
+
+        [HOW TO THINK ABOUT THE VARIABLES]
+        - FCF Growth (Years 1-5): Base this on the company's recent growth trajectory, TAM expansion, and pricing power. If the moat is shrinking, penalize the Bear case heavily.
+        - FCF Growth (Years 6-10): Assume a natural linear deceleration as the company and its market mature.
+        - WACC (Discount Rate): Reflects the risk premium. A highly predictable, monopolistic business commands a lower WACC (0.075 - 0.09). A highly cyclical or risky business should have a higher WACC (0.10 - 0.13). Vary the WACC slightly across scenarios to reflect the perceived stability of the moat.
+        - Terminal Growth Rate: Rate after year 10. This MUST be conservative. It usually ranges between 0.02 and 0.03, aligning with expected long-term global GDP growth and inflation. Never exceed 0.035 unless absolutely justifiable.
+
+        [QUALITY EXAMPLE - FAIR SCENARIO FOR GOOG]
+        "fcf_growth_1_to_5": 0.15,
+        "fcf_growth_6_to_10": 0.10,
+        "wacc": 0.085,
+        "terminal_growth_rate": 0.025,
+        "justification": "Alphabet's 'Fair' scenario assumes steady growth supported by its Cloud infrastructure and efficient AI integration. The Search moat remains resilient but faces gradual structural challenges, prompting a linear deceleration in the back half of the decade. A conservative 8.5% WACC reflects its unshakeable balance sheet and deeply entrenched ecosystem."
+        
+        Do not include markdown headers (like ```json), intro text, or conclusions. Return only raw JSON.
+        """
+
+def _template_tag(template: str) -> str:
+    """Short content hash of a prompt template, used in cache keys so edited prompts never serve stale analyses."""
+    return hashlib.sha256(template.encode("utf-8")).hexdigest()[:8]
+
+_COMPANY_PROFILE_TAG = _template_tag(_COMPANY_PROFILE_PROMPT)
+_INDUSTRY_DYNAMICS_TAG = _template_tag(_INDUSTRY_DYNAMICS_PROMPT)
+_EARNINGS_REPORT_TAG = _template_tag(_EARNINGS_REPORT_PROMPT)
+_DCF_ASSUMPTIONS_TAG = _template_tag(_DCF_ASSUMPTIONS_PROMPT)
+
+class BaseLLMAdapter(SectorIndustrialDataPort, EarningsReportPort, QualitativeDataPort, IntrinsicValueCalculationPort, ABC):
+    """
+    Abstract Base Class for LLM Adapters to enforce DRY principles.
+    Implements generic caching, schema validation, entity mapping, and translation logic.
+    Subclasses only need to implement the actual LLM API calls.
+    """
+    
+    def __init__(self, translator: Optional[TranslationPort] = None):
+        self.translator = translator
+        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+        self.cache_dir = os.path.join(base_dir, '.llm_cache')
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @abstractmethod
+    async def _generate_company_profile(self, prompt: str, schema: Type[T]) -> dict:
+        """Call the LLM API to generate the company profile JSON."""
+        pass
+
+    @abstractmethod
+    async def _generate_industry_dynamics(self, prompt: str, schema: Type[T]) -> dict:
+        """Call the LLM API to generate the industry dynamics JSON."""
+        pass
+
+    @abstractmethod
+    async def _generate_earnings_report(self, prompt: str, pdf_file_path: str, schema: Type[T]) -> dict:
+        """Call the LLM API to analyze an earnings report PDF."""
+        pass
+
+    @abstractmethod
+    async def _generate_dcf_assumptions(self, prompt: str, schema: Type[T]) -> dict:
+        """Call the LLM API to generate DCF assumptions."""
+        pass
+
+    def _get_cached_data(self, cache_path: str) -> Optional[dict]:
+        if os.path.exists(cache_path) and time.time() - os.path.getmtime(cache_path) < 86400:
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception:
+                pass
+        return None
+
+    def _set_cached_data(self, cache_path: str, data: dict):
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=4)
+
+    async def analyse_company(self, symbol: str, language: str = "en", context: str = "") -> CompanyProfile:
+        context_prompt = f"\n\nREAL-WORLD CONTEXT (USE THIS AS ABSOLUTE TRUTH):\n{context}\n" if context else ""
+        
+        prompt = _COMPANY_PROFILE_PROMPT.format(symbol=symbol, context_prompt=context_prompt)
+
+        cache_filename = f"company_{symbol.upper()}_{_COMPANY_PROFILE_TAG}_{language}.json"
+        target_dir = os.path.join(self.cache_dir, symbol.upper(), "analysis")
+        os.makedirs(target_dir, exist_ok=True)
+        cache_path = os.path.join(target_dir, cache_filename)
+        cache_filename_en = f"company_{symbol.upper()}_{_COMPANY_PROFILE_TAG}_en.json"
+        cache_path_en = os.path.join(target_dir, cache_filename_en)
+        
+        # Each payload is validated once; the instance is reused instead of re-parsing the same dict.
+        schema_instance = None
+        data = self._get_cached_data(cache_path)
+        if not data:
+            data_en = self._get_cached_data(cache_path_en)
+            if not data_en:
+                data_en = await self._generate_company_profile(prompt, CompanyProfileSchema)
+                try:
+                    schema_instance = CompanyProfileSchema(**data_en)
+                except ValidationError as ve:
+                    raise LLMParsingError(f"LLM returned invalid JSON structure: {ve}")
+                self._set_cached_data(cache_path_en, data_en)
+            
+            if language != "en" and self.translator:
+                data = await self.translator.translate_json(data_en, language)
+                schema_instance = None
+            else:
+                data = data_en
+                
+            if schema_instance is None:
+                try:
+                    schema_instance = CompanyProfileSchema(**data)
+                except ValidationError as ve:
+                    raise LLMParsingError(f"Translator returned invalid JSON structure: {ve}")
+            if cache_path != cache_path_en:
+                self._set_cached_data(cache_path, data)
+
+        if schema_instance is None:
+            if "sources" in data and isinstance(data["sources"], dict):
+                new_sources = []
+                for k, v in data["sources"].items():
+                    v["citation_id"] = str(k)
+                    new_sources.append(v)
+                data["sources"] = new_sources
+
+            schema_instance = CompanyProfileSchema(**data)
+        
+        return CompanyProfile(
+            business_description="", # Injected later by UseCase
+            company_history=schema_instance.company_history,
+            key_executives=[{"name": e.name, "title": e.title, "ownership": float(e.ownership) if e.ownership is not None else None} for e in schema_instance.key_executives],
+            revenue_model=schema_instance.revenue_model,
+            strategy=schema_instance.strategy,
+            products_services={p.name: p.description for p in schema_instance.products_services},
+            competitive_advantage=schema_instance.competitive_advantage,
+            competitors=[{"name": c.name, "ticker": c.ticker, "overlap": c.overlap} for c in schema_instance.competitors],
+            management_insights=schema_instance.management_insights,
+            risk_factors={r.title: r.description for r in schema_instance.risk_factors},
+            historical_context_crises=schema_instance.historical_context_crises,
+            moat_trajectory_status=schema_instance.moat_trajectory_status,
+            moat_trajectory_description=schema_instance.moat_trajectory_description,
+            # Iterating a model yields its (field, value) pairs directly, without a model_dump() serializer pass
+            moat_sources=MoatSources(**dict(schema_instance.moat_sources)),
+            quality_pillars=QualityPillars(**dict(schema_instance.quality_pillars)),
+            capital_allocation_strategy=schema_instance.capital_allocation_strategy,
+            near_term_catalysts=[NearTermCatalyst(event=c.event, impact=c.impact) for c in schema_instance.near_term_catalysts],
+            sources={s.citation_id: EntitySourceInfo(url=s.url, title=s.title) for s in schema_instance.sources}
+        )
+
+    async def analyse_industry(self, sector: str, industry: str, language: str = "en", ticker: str = "", context: str = "") -> IndustrySectorDynamics:
+        context_prompt = f"\n\nREAL-WORLD CONTEXT (USE THIS AS ABSOLUTE TRUTH):\n{context}\n" if context else ""
+
+        prompt = _INDUSTRY_DYNAMICS_PROMPT.format(ticker=ticker, sector=sector, industry=industry, context_prompt=context_prompt)
         
         safe_sector = re.sub(r'[^a-zA-Z0-9]', '_', sector)
         safe_industry = re.sub(r'[^a-zA-Z0-9]', '_', industry)
-        cache_filename = f"industry_{safe_sector}_{safe_industry}_{language}.json"
+        cache_filename = f"industry_{safe_sector}_{safe_industry}_{_INDUSTRY_DYNAMICS_TAG}_{language}.json"
         
         if ticker:
             target_dir = os.path.join(self.cache_dir, ticker.upper(), "analysis")
@@ -283,39 +372,45 @@ class BaseLLMAdapter(SectorIndustrialDataPort, EarningsReportPort, QualitativeDa
         os.makedirs(target_dir, exist_ok=True)
         cache_path = os.path.join(target_dir, cache_filename)
         
-        cache_filename_en = f"industry_{safe_sector}_{safe_industry}_en.json"
+        cache_filename_en = f"industry_{safe_sector}_{safe_industry}_{_INDUSTRY_DYNAMICS_TAG}_en.json"
         cache_path_en = os.path.join(target_dir, cache_filename_en)
         
+        # Each payload is validated once; the instance is reused instead of re-parsing the same dict.
+        schema_instance = None
         data = self._get_cached_data(cache_path)
         if not data:
             data_en = self._get_cached_data(cache_path_en)
             if not data_en:
                 data_en = await self._generate_industry_dynamics(prompt, IndustrySectorDynamicsSchema)
                 try:
-                    IndustrySectorDynamicsSchema(**data_en)
+                    schema_instance = IndustrySectorDynamicsSchema(**data_en)
                 except ValidationError as ve:
                     raise LLMParsingError(f"LLM returned invalid JSON structure: {ve}")
                 self._set_cached_data(cache_path_en, data_en)
             
             if language != "en" and self.translator:
                 data = await self.translator.translate_json(data_en, language)
+                schema_instance = None
             else:
                 data = data_en
                 
-            try:
-                IndustrySectorDynamicsSchema(**data)
-            except ValidationError as ve:
-                raise LLMParsingError(f"Translator returned invalid JSON structure: {ve}")
-            self._set_cached_data(cache_path, data)
-
-        if "sources" in data and isinstance(data["sources"], dict):
-            new_sources = []
-            for k, v in data["sources"].items():
-                v["citation_id"] = str(k)
-                new_sources.append(v)
-            data["sources"] = new_sources
-
-        schema_instance = IndustrySectorDynamicsSchema(**data)
+            if schema_instance is None:
+                try:
+                    schema_instance = IndustrySectorDynamicsSchema(**data)
+                except ValidationError as ve:
+                    raise LLMParsingError(f"Translator returned invalid JSON structure: {ve}")
+            if cache_path != cache_path_en:
+                self._set_cached_data(cache_path, data)
+
+        if schema_instance is None:
+            if "sources" in data and isinstance(data["sources"], dict):
+                new_sources = []
+                for k, v in data["sources"].items():
+                    v["citation_id"] = str(k)
+                    new_sources.append(v)
+                data["sources"] = new_sources
+
+            schema_instance = IndustrySectorDynamicsSchema(**data)
         
         return IndustrySectorDynamics(
             sector=schema_instance.sector,
@@ -335,48 +430,15 @@ class BaseLLMAdapter(SectorIndustrialDataPort, EarningsReportPort, QualitativeDa
         if focus_period:
             focus_instruction = f"\n\n        CRITICAL: The user requested an analysis exclusively for the period {focus_period}. This document is an annual report, but you MUST isolate and extract ONLY the performance, guidance, and events pertaining to {focus_period}, ignoring the rest of the year."
 
-        prompt = f"""
-        You are a Senior Equity Analyst focused on long-term value investing. I am providing the full text of an Earnings Report for the company "{symbol}". Ignore short-term stock reactions and Wall Street consensus. Focus exclusively on underlying business fundamentals.{focus_instruction}
-
-        Perform a deep-dive analysis and return ONLY a structured JSON object. Do not include markdown formatting, code blocks, or conversational text.
-        Language: Generate ALL analysis text strictly in English. The JSON keys must remain in English as defined by the schema.
-
-        CRITICAL MATHEMATICAL RULES:
-        - For margins, output as whole percentages (e.g. 66.3 for 66.3%) and NOT as decimals (e.g. 0.663).
-        - ALWAYS output absolute monetary amounts strictly in BILLIONS. For example, 500 million must be written as 0.5. 17.6 billion must be written as 17.6. NEVER output raw large numbers.
-        - If a metric is fundamentally not applicable to the business model (like gross margin for a bank), output null.
-
-        CRITICAL TEMPORAL SCOPE:
-        - If the document is a quarterly report (10-Q), you MUST extract financial figures (Revenue, Margins, Cash Flows, CapEx) exclusively from the isolated 'Three Months Ended' column. NEVER extract the 'Six Months Ended', 'Nine Months Ended' or 'Year-to-Date' cumulative columns.
-        - If the document is an annual report (10-K), extract the full fiscal year figures.
-
-        Extract and synthesize the following fields EXACTLY as named.
-
-        1. period_end_date: (String) The end date of the fiscal period strictly in 'YYYY-MM-DD' format.
-        2. core_performance: (Object) Extract Adjusted (Non-GAAP) Revenue, Adjusted EPS, Adjusted Gross Margin, Adjusted Operating Margin, Adjusted Net Margin, and Free Cash Flow. Free Cash Flow MUST be calculated as 'Net Cash from Operations' minus 'CapEx' (Additions to property and equipment). For each metric, return an object with a single float field: 'amount'. Do NOT include any growth or YoY calculations — those are computed externally from verified data.
-        3. capital_allocation: (Object) Detail exact amounts (as floats, in billions) spent on 'share_buybacks', 'dividends', and 'capex_rd'. Also provide an 'infrastructure_assessment' string containing a full 2-3 sentence paragraph assessing the "why" behind the CapEx. You MUST extract specific hardware names, exact geographic locations of new facilities, specific project names, or exact financial sub-allocations if mentioned. Assess whether this CapEx cycle appears Defensive or Offensive. Explicitly IGNORE generic corporate jargon like "meeting customer needs" or "investing for the future".
-        4. forward_guidance: (String) Detailed 2-3 sentence analysis of management's forward-looking projections and guidance.
-        5. moat_trajectory_status: (String) Exactly "EXPANDING", "STABLE", or "SHRINKING".
-        5b. moat_trajectory_description: (String) Detailed 2-3 sentence analysis of the company's competitive advantage trajectory.
-        6. risk_deconstruction: (Object) Separate headwinds into two string lists (arrays of strings): 'macro_risks' (external) and 'internal_risks' (execution/product). Each individual risk must be a separate string element in the array. You MUST include numerical citations directly inside each string.
-        7. bottom_line: (String) A brutal, concise summary answering: Did the underlying business execute well, or are structural cracks forming?
-        8. sources: (List of Objects) You MUST provide inline numerical citations (e.g. [1], [2]) directly within your narrative text for fields like 'infrastructure_assessment', 'forward_guidance', 'moat_trajectory_description', 'risk_deconstruction', and 'bottom_line'. Then, in this 'sources' array, return a list of objects each containing 'citation_number' (integer) and 'source_text' (string). 
-        CRITICAL: The 'source_text' MUST be the exact raw quote or sentence from the document that proves your claim (e.g. "Cloud revenue grew 24% driven by AI workload demand"). DO NOT just provide page numbers or section titles. Citations must be strictly sequential (1, 2, 3...) with no skipped numbers.
-
-        QUALITY EXAMPLES (follow this tone and depth):
-        GOOD bottom_line: "Alphabet executed strongly: Search revenue grew 12% YoY driven by AI Overviews adoption, Cloud crossed the $12B annualized run-rate with 28% margins, and the $70B buyback signals management's confidence in sustained free cash flow generation [1]. The key risk is a potential deceleration in ad spend if macro conditions deteriorate [2]."
-        BAD bottom_line: "The company did well this quarter and beat expectations."
-        GOOD infrastructure_assessment: "CapEx surged to $30.8B, aggressively allocated to scaling Azure's AI infrastructure. Management is securing scarce GPU supply and building next-gen liquid-cooled datacenters, signaling an offensive land-grab in AI compute. This massive capital intensity will compress near-term operating margins but is designed to lock in long-term enterprise AI workloads."
-        BAD infrastructure_assessment: "The company is spending more on datacenters to meet growing AI demand and serve customers better."
-        """
+        prompt = _EARNINGS_REPORT_PROMPT.format(symbol=symbol, focus_instruction=focus_instruction)
 
         with open(pdf_file_path, "rb") as f:
             file_hash = hashlib.md5(f.read()).hexdigest()[:12]
-        cache_filename = f"earnings_{symbol.upper()}_{file_hash}_{language}.json"
+        cache_filename = f"earnings_{symbol.upper()}_{file_hash}_{_EARNINGS_REPORT_TAG}_{language}.json"
         target_dir = os.path.join(self.cache_dir, symbol.upper(), "analysis")
         os.makedirs(target_dir, exist_ok=True)
         cache_path = os.path.join(target_dir, cache_filename)
-        cache_filename_en = f"earnings_{symbol.upper()}_{file_hash}_en.json"
+        cache_filename_en = f"earnings_{symbol.upper()}_{file_hash}_{_EARNINGS_REPORT_TAG}_en.json"
         cache_path_en = os.path.join(target_dir, cache_filename_en)
         
         data = self._get_cached_data(cache_path)
@@ -444,40 +506,13 @@ class BaseLLMAdapter(SectorIndustrialDataPort, EarningsReportPort, QualitativeDa
         )
 
     async def deduce_dcf_assumptions(self, ticker: str, company_profile: dict, quant_data: dict, language: str = "en") -> dict:
-        prompt = f"""
-        You are a top-tier Wall Street Financial Analyst specializing in Discounted Cash Flow (DCF) valuation and competitive moat assessment.
-        Your task is to deduce the most realistic future growth assumptions for {ticker} based on its historical performance, business model resilience, and macroeconomic context.
-
-        CRITICAL RULES:
-        1. DO NOT calculate the intrinsic value. Your ONLY job is to provide the growth rates, WACC, and terminal growth rate. The mathematical calculation will be handled by our deterministic backend engine.
-        2. Provide your assumptions for three scenarios: Bear (Pessimistic), Fair (Base Case), and Bull (Optimistic).
-        3. Provide a clear, sharp, and highly analytical justification (1-2 paragraphs) for why you chose these specific rates for each scenario.
-        4. Always respond strictly in English and format your response matching the provided JSON schema. All rates MUST be expressed as decimals (e.g. 15% is 0.15).
-
-        [CONTEXT INJECTED BY US]
-        COMPANY PROFILE & QUALITATIVE MOAT:
-        {json.dumps(company_profile, indent=2)}
-
-        QUANTITATIVE METRICS (FCF HISTORY & MARGINS):
-        {json.dumps(quant_data, indent=2)}
-
-        [HOW TO THINK ABOUT THE VARIABLES]
-        - FCF Growth (Years 1-5): Base this on the company's recent growth trajectory, TAM expansion, and pricing power. If the moat is shrinking, penalize the Bear case heavily.
-        - FCF Growth (Years 6-10): Assume a natural linear deceleration as the company and its market mature.
-        - WACC (Discount Rate): Reflects the risk premium. A highly predictable, monopolistic business commands a lower WACC (0.075 - 0.09). A highly cyclical or risky business should have a higher WACC (0.10 - 0.13). Vary the WACC slightly across scenarios to reflect the perceived stability of the moat.
-        - Terminal Growth Rate: Rate after year 10. This MUST be conservative. It usually ranges between 0.02 and 0.03, aligning with expected long-term global GDP growth and inflation. Never exceed 0.035 unless absolutely justifiable.
-
-        [QUALITY EXAMPLE - FAIR SCENARIO FOR GOOG]
-        "fcf_growth_1_to_5": 0.15,
-        "fcf_growth_6_to_10": 0.10,
-        "wacc": 0.085,
-        "terminal_growth_rate": 0.025,
-        "justification": "Alphabet's 'Fair' scenario assumes steady growth supported by its Cloud infrastructure and efficient AI integration. The Search moat remains resilient but faces gradual structural challenges, prompting a linear deceleration in the back half of the decade. A conservative 8.5% WACC reflects its unshakeable balance sheet and deeply entrenched ecosystem."
-        
-        Do not include markdown headers (like ```json), intro text, or conclusions. Return only raw JSON.
-        """
+        prompt = _DCF_ASSUMPTIONS_PROMPT.format(
+            ticker=ticker,
+            company_profile_json=json.dumps(company_profile, indent=2),
+            quant_data_json=json.dumps(quant_data, indent=2)
+        )
 
-        cache_filename_en = f"dcf_{ticker.upper()}_en.json"
+        cache_filename_en = f"dcf_{ticker.upper()}_{_DCF_ASSUMPTIONS_TAG}_en.json"
         target_dir = os.path.join(self.cache_dir, ticker.upper(), "analysis")
         os.makedirs(target_dir, exist_ok=True)
         cache_path_en = os.path.join(target_dir, cache_filename_en)
@@ -1,44 +1,95 @@
 from google import genai
 from google.genai import types
-import json
+import orjson
 import asyncio
-from typing import Optional, Type, TypeVar
+from typing import NamedTuple, Optional, Type, TypeVar
 from pydantic import BaseModel
 from application.exceptions.exceptions import RateLimitExceededError, ConfigurationError, ExternalServiceError, InvalidDocumentFormatError
 from application.ports.translation_port import TranslationPort
 from infrastructure.utils.llm_utils import extract_json_from_response
+from infrastructure.utils.http_utils import LoopBound
 from .base_llm_adapter import BaseLLMAdapter
 
 T = TypeVar('T', bound=BaseModel)
 
+_RATE_LIMIT_MARKERS = ("429", "rate limit", "quota", "exhausted")
+
+def _map_gemini_error(e: Exception) -> Exception:
+    """
+    Translates a Gemini SDK failure into the application's exception types.
+    
+    Args:
+        e (Exception): The exception raised while calling Gemini.
+        
+    Returns:
+        Exception: RateLimitExceededError for quota/429 failures, ExternalServiceError otherwise.
+    """
+    error_str = str(e).lower()
+    if any(marker in error_str for marker in _RATE_LIMIT_MARKERS):
+        return RateLimitExceededError(f"Gemini Rate Limit: {e}")
+    return ExternalServiceError(f"Gemini API Error: {e}")
+
+class _GeminiSession(NamedTuple):
+    """The Gemini client of one event loop and the request slots that throttle it."""
+    client: genai.Client
+    request_slots: asyncio.Semaphore
+
 class GeminiAdapter(BaseLLMAdapter):
     """
     Adapter that leverages Google's Gemini LLM to generate qualitative research and DCF assumptions.
     """
+    MAX_CONCURRENT_REQUESTS = 4 # keeps batch analyses under the Gemini requests-per-minute quota
+
     def __init__(self, api_key: Optional[str] = None, client: Optional[genai.Client] = None, translator: Optional[TranslationPort] = None):
         super().__init__(translator=translator)
         if client:
-            self.client = client
+            self._owns_client = False
+            make_client = lambda: client
         else:
             if not api_key:
                 raise ConfigurationError("Gemini API Key is required")
-            self.client = genai.Client(api_key=api_key)
+            self._owns_client = True
+            make_client = lambda: genai.Client(api_key=api_key)
             
+        # The async HTTP pool inside genai.Client and the semaphore throttling it are both tied to the loop
+        # they first ran in, so each adapter builds them together per event loop instead of sharing them.
+        self._sessions = LoopBound(lambda: _GeminiSession(make_client(), asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)))
         self.model_id = 'gemini-2.5-flash'
 
+    @property
+    def client(self) -> genai.Client:
+        """The Gemini client for the running event loop."""
+        return self._sessions.get().client
+
+    @property
+    def _request_slots(self) -> asyncio.Semaphore:
+        """The slots capping concurrent generate_content calls on this loop's client."""
+        return self._sessions.get().request_slots
+
+    async def aclose(self):
+        """
+        Closes the Gemini client built for the running event loop, releasing its HTTP connections.
+        """
+        session = self._sessions.release()
+        if session is not None and self._owns_client:
+            await session.client.aio.aclose()
+
     async def _generate_company_profile(self, prompt: str, schema: Type[T]) -> dict:
         strict_search_mandate = "\n\nCRITICAL MANDATE: You MUST actively trigger the Google Search tool. Your response will be REJECTED if you do not use the search tool."
         current_prompt = prompt + strict_search_mandate
         
+        # JSON mode (response_mime_type/response_schema) cannot be combined with the google_search tool,
+        # so this call stays free-text and is parsed by extract_json_from_response. The other calls use JSON mode.
         try:
-            response = await self.client.aio.models.generate_content(
-                model=self.model_id,
-                contents=current_prompt,
-                config=types.GenerateContentConfig(
-                    temperature=0.0,
-                    tools=[{"google_search": {}}]
+            async with self._request_slots:
+                response = await self.client.aio.models.generate_content(
+                    model=self.model_id,
+                    contents=current_prompt,
+                    config=types.GenerateContentConfig(
+                        temperature=0.0,
+                        tools=[{"google_search": {}}]
+                    )
                 )
-            )
             raw_text = response.text
             sources = []
             try:
@@ -76,29 +127,24 @@ class GeminiAdapter(BaseLLMAdapter):
             data_en['sources'] = sources
             return data_en
         except Exception as e:
-            error_str = str(e).lower()
-            if "429" in error_str or "rate limit" in error_str or "quota" in error_str or "exhausted" in error_str:
-                raise RateLimitExceededError(f"Gemini Rate Limit: {e}")
-            raise ExternalServiceError(f"Gemini API Error: {e}")
+            raise _map_gemini_error(e)
 
     async def _generate_industry_dynamics(self, prompt: str, schema: Type[T]) -> dict:
         try:
-            response = await self.client.aio.models.generate_content(
-                model='gemini-3.5-flash',
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json",
-                    response_schema=schema,
-                    temperature=0.0,
-                    max_output_tokens=8192
+            async with self._request_slots:
+                response = await self.client.aio.models.generate_content(
+                    model='gemini-3.5-flash',
+                    contents=prompt,
+                    config=types.GenerateContentConfig(
+                        response_mime_type="application/json",
+                        response_schema=schema,
+                        temperature=0.0,
+                        max_output_tokens=8192
+                    )
                 )
-            )
             return extract_json_from_response(response.text)
         except Exception as e: 
-            error_str = str(e).lower()
-            if "429" in error_str or "rate limit" in error_str or "quota" in error_str or "exhausted" in error_str:
-                raise RateLimitExceededError(f"Gemini Rate Limit: {e}")
-            raise ExternalServiceError(f"Gemini API Error: {e}")
+            raise _map_gemini_error(e)
 
     async def _generate_earnings_report(self, prompt: str, pdf_file_path: str, schema: Type[T]) -> dict:
         uploaded_file = None
@@ -112,23 +158,21 @@ class GeminiAdapter(BaseLLMAdapter):
             if file_info.state.name == "FAILED":
                 raise InvalidDocumentFormatError("Gemini failed to process the uploaded document.")
 
-            response = await self.client.aio.models.generate_content(
-                model=self.model_id,
-                contents=[prompt, uploaded_file],
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json",
-                    response_schema=schema,
-                    temperature=0.0
+            async with self._request_slots:
+                response = await self.client.aio.models.generate_content(
+                    model=self.model_id,
+                    contents=[prompt, uploaded_file],
+                    config=types.GenerateContentConfig(
+                        response_mime_type="application/json",
+                        response_schema=schema,
+                        temperature=0.0
+                    )
                 )
-            )
-            return json.loads(response.text)
+            return orjson.loads(response.text)
+        except InvalidDocumentFormatError:
+            raise
         except Exception as e: 
-            error_str = str(e).lower()
-            if "429" in error_str or "rate limit" in error_str or "quota" in error_str or "exhausted" in error_str:
-                raise RateLimitExceededError(f"Gemini Rate Limit: {e}")
-            elif isinstance(e, InvalidDocumentFormatError):
-                raise
-            raise ExternalServiceError(f"Gemini API Error: {e}")
+            raise _map_gemini_error(e)
         finally:
             if uploaded_file is not None:
                 try:
@@ -138,18 +182,16 @@ class GeminiAdapter(BaseLLMAdapter):
 
     async def _generate_dcf_assumptions(self, prompt: str, schema: Type[T]) -> dict:
         try:
-            response = await self.client.aio.models.generate_content(
-                model=self.model_id,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json",
-                    response_schema=schema,
-                    temperature=0.0,
+            async with self._request_slots:
+                response = await self.client.aio.models.generate_content(
+                    model=self.model_id,
+                    contents=prompt,
+                    config=types.GenerateContentConfig(
+                        response_mime_type="application/json",
+                        response_schema=schema,
+                        temperature=0.0,
+                    )
                 )
-            )
-            return json.loads(response.text)
+            return orjson.loads(response.text)
         except Exception as e: 
-            error_str = str(e).lower()
-            if "429" in error_str or "rate limit" in error_str or "quota" in error_str or "exhausted" in error_str:
-                raise RateLimitExceededError(f"Gemini Rate Limit: {e}")
-            raise ExternalServiceError(f"Gemini API Error: {e}")
\ No newline at end of file
+            raise _map_gemini_error(e)
\ No newline at end of file
@@ -1,17 +1,40 @@
 import os
+import asyncio
 import glob
 import shutil
 import re
+import time
+import logging
 from bs4 import BeautifulSoup
 from typing import List
 from sec_edgar_downloader import Downloader
 from application.ports.filing_repository_port import FilingRepositoryPort
 from application.dtos import LocalFilingDTO
 
+# lxml's C parser is several times faster than html.parser on multi-megabyte 10-K/10-Q documents.
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+logger = logging.getLogger(__name__)
+
 class SECAdapter(FilingRepositoryPort):
+    # Script, style, and metadata/XBRL elements that pollute the extracted text
+    _STRIP_TAGS = ("script", "style", "head", "ix:header", "xbrli:context", "xbrli:unit")
+    # full-submission.txt header fields
+    _PERIOD_OF_REPORT_RE = re.compile(r'CONFORMED PERIOD OF REPORT:\s*(\d{8})')
+    _FISCAL_YEAR_END_RE = re.compile(r'FISCAL YEAR END:\s*(\d{4})')
+    # Parsed filing names: {TICKER}_{FORM}_{PERIOD}_{ACCESSION}.txt
+    _FILING_NAME_RE = re.compile(r'^([A-Z0-9]+)_(10-K|10-Q)(_[A-Z0-9\-]+)_([0-9\-]+)\.txt$')
+    _QUARTER_FILING_RE = re.compile(r'([A-Z0-9]+)_10-Q_([0-9]{4})-Q([1-3])_')
+
     def __init__(self, cache_dir: str = ".llm_cache"):
         self.cache_dir = cache_dir
         self.dl = Downloader("EquityValuationEngine", "alvaro@example.com", self.cache_dir)
+        # Downloads share the sec-edgar-filings staging folder (wiped after each run), so they are serialised
+        self._download_lock = asyncio.Lock()
         
         if not os.path.exists(self.cache_dir):
             os.makedirs(self.cache_dir)
@@ -20,10 +43,10 @@ class SECAdapter(FilingRepositoryPort):
         """
         Removes HTML tags, scripts, and tables, keeping only readable text.
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, _HTML_PARSER)
         
         # Remove script, style, and metadata/XBRL elements that pollute the text
-        for element in soup(["script", "style", "head", "ix:header", "xbrli:context", "xbrli:unit"]):
+        for element in soup(self._STRIP_TAGS):
             element.extract()
 
         # Get text, strip whitespace
@@ -34,7 +57,13 @@ class SECAdapter(FilingRepositoryPort):
         """
         Downloads SEC filings using sec-edgar-downloader, parses HTML,
         and saves as plain text in the cache directory.
+        The blocking download and HTML parsing run in a worker thread so the event loop keeps
+        serving other tickers' requests meanwhile.
         """
+        async with self._download_lock:
+            return await asyncio.to_thread(self._download_latest_sec_filings_sync, ticker, form_type, limit)
+
+    def _download_latest_sec_filings_sync(self, ticker: str, form_type: str, limit: int = 1) -> List[str]:
         # Download filing
         # Downloader creates structure: {cache_dir}/sec-edgar-filings/{ticker}/{form_type}/{accession_number}/full.txt
         self.dl.get(form_type, ticker, limit=limit, download_details=True)
@@ -78,13 +107,13 @@ class SECAdapter(FilingRepositoryPort):
                     try:
                         with open(full_txt_path, 'r', encoding='utf-8', errors='ignore') as ft:
                             header_content = ft.read(10000)
-                            match = re.search(r'CONFORMED PERIOD OF REPORT:\s*(\d{8})', header_content)
+                            match = self._PERIOD_OF_REPORT_RE.search(header_content)
                             if match:
                                 date_str = match.group(1) # e.g. 20240930
                                 year = int(date_str[:4])
                                 month = int(date_str[4:6])
                                 
-                                fy_match = re.search(r'FISCAL YEAR END:\s*(\d{4})', header_content)
+                                fy_match = self._FISCAL_YEAR_END_RE.search(header_content)
                                 fy_end_month = 12
                                 if fy_match:
                                     fy_end_month = int(fy_match.group(1)[:2])
@@ -140,14 +169,17 @@ class SECAdapter(FilingRepositoryPort):
         if not os.path.exists(base_dir):
             return filings
             
+        prefix = f"{ticker.upper()}_"
+        match_name = self._FILING_NAME_RE.match
         for root, _, files in os.walk(base_dir):
             for file in files:
-                if file.endswith(".txt") and file.startswith(f"{ticker.upper()}_"):
-                    match = re.match(r'^([A-Z0-9]+)_(10-K|10-Q)(_[A-Z0-9\-]+)_([0-9\-]+)\.txt$', file)
+                # The prefix check rejects foreign files cheaply; the pattern itself enforces the .txt suffix
+                if file.startswith(prefix):
+                    match = match_name(file)
                     if match:
                         t, form_type, period_suffix, accession = match.groups()
                         period = period_suffix.lstrip('_')
-                        filings.append(LocalFilingDTO(
+                        filings.append(LocalFilingDTO.model_construct( # fields are regex groups, already str
                             id=os.path.join(root, file),
                             form_type=form_type,
                             period=period,
@@ -156,10 +188,6 @@ class SECAdapter(FilingRepositoryPort):
         return sorted(filings, key=lambda x: x.period, reverse=True)
 
     async def get_available_filings(self, ticker: str) -> List[LocalFilingDTO]:
-        import time
-        import logging
-        logger = logging.getLogger(__name__)
-        
         cache_dir = os.path.join(self.cache_dir, ticker.upper(), "filings")
         
         need_download = True
@@ -195,10 +223,8 @@ class SECAdapter(FilingRepositoryPort):
         return self._list_local_sec_filings_internal(ticker)
 
     async def get_filing_paths_for_rag(self, ticker: str, period: str = None) -> List[str]:
-        # Ensure filings exist
-        await self.get_available_filings(ticker)
-        
-        filings = self._list_local_sec_filings_internal(ticker)
+        # Ensure filings exist; the returned listing is reused instead of walking the cache directory again
+        filings = await self.get_available_filings(ticker)
         k_files = [f.id for f in filings if f.form_type == "10-K"]
         q_files = [f.id for f in filings if f.form_type == "10-Q"]
         
@@ -223,9 +249,8 @@ class SECAdapter(FilingRepositoryPort):
                 
             if target_q:
                 files_to_inject.append(target_q)
-                import re
                 target_q_name = os.path.basename(target_q)
-                match = re.search(r'([A-Z0-9]+)_10-Q_([0-9]{4})-Q([1-3])_', target_q_name)
+                match = self._QUARTER_FILING_RE.search(target_q_name)
                 if match:
                     t, year, q_num = match.groups()
                     prev_year = str(int(year) - 1)
@@ -1,24 +1,79 @@
 import yfinance as yf
 from decimal import Decimal
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 import asyncio
+import time
 import pandas as pd
 import httpx
 
-from infrastructure.mappers.yfinance_mapper import parse_financial_period
+from infrastructure.mappers.yfinance_mapper import parse_financial_period, to_decimal
+from infrastructure.utils.http_utils import LoopBoundAsyncClient
 from domain.entities import Price, FinancialYear, FinancialQuarter, Ticker
 from application.exceptions.exceptions import TickerNotFoundError, DataFetchError
 from application.ports.core_financial_ports import QuantitativeDataPort, PerformanceDataPort, OwnershipDataPort
 from application.ports.discovery_ports import TrendingDataPort, SearchDataPort
 
+_ZERO = Decimal(0)
+
 class YfinanceAdapter(QuantitativeDataPort, TrendingDataPort, SearchDataPort, PerformanceDataPort, OwnershipDataPort):
     """
     Adapter for fetching stock data using the yfinance library.
     Implements QuantitativeDataPort, TrendingDataPort, SearchDataPort, PerformanceDataPort, and OwnershipDataPort.
     """
     
+    TICKER_CACHE_TTL = 900 # seconds a yf.Ticker (and the statements/info it memoises) is reused
+    TICKER_CACHE_SIZE = 256 # cached yf.Ticker instances; the oldest entry is evicted first
+    QUOTE_CACHE_TTL = 300 # seconds the live quote fields of ticker.info may be reused, as for GLOBAL_QUOTE
+
     def __init__(self):
-        pass
+        self._tickers: Dict[str, Tuple[float, yf.Ticker]] = {}
+        # Search runs on every keystroke, so reusing warm keep-alive connections avoids a TCP and TLS
+        # handshake per query; the transport also retries transient connection failures.
+        self._search_client = LoopBoundAsyncClient(
+            lambda: httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+                transport=httpx.AsyncHTTPTransport(retries=2)
+            )
+        )
+
+    async def aclose(self):
+        """
+        Closes the pooled HTTP client used for Yahoo autocomplete.
+        """
+        await self._search_client.aclose()
+
+    async def _get_ticker(self, symbol: str, max_age: Optional[float] = None) -> yf.Ticker:
+        """
+        Returns a yf.Ticker for the symbol, reusing a recent instance so the statements and info it has
+        already downloaded are served from memory instead of being fetched again by each method.
+        
+        Args:
+            symbol (str): The stock ticker symbol (e.g., "AAPL").
+            max_age (Optional[float]): Maximum age in seconds of a reusable instance. Defaults to
+                                       TICKER_CACHE_TTL; an older cached instance is kept for other callers
+                                       and a fresh, uncached one is returned instead.
+            
+        Returns:
+            yf.Ticker: The (possibly shared) yfinance Ticker object.
+        """
+        key = symbol.upper()
+        now = time.monotonic()
+        # Entries are kept in creation order, so the expired ones are always at the front
+        while self._tickers:
+            oldest = next(iter(self._tickers))
+            if now - self._tickers[oldest][0] < self.TICKER_CACHE_TTL:
+                break
+            del self._tickers[oldest]
+            
+        cached = self._tickers.get(key)
+        if cached is not None and now - cached[0] < (self.TICKER_CACHE_TTL if max_age is None else max_age):
+            return cached[1]
+        ticker = await asyncio.to_thread(yf.Ticker, symbol)
+        if cached is None:
+            if len(self._tickers) >= self.TICKER_CACHE_SIZE:
+                del self._tickers[next(iter(self._tickers))]
+            self._tickers[key] = (time.monotonic(), ticker)
+        return ticker
 
     async def get_stock_current_price(self, symbol: str) -> Price:
         """
@@ -32,7 +87,8 @@ class YfinanceAdapter(QuantitativeDataPort, TrendingDataPort, SearchDataPort, Pe
         """
         try:
                 
-            # Run yfinance blocking calls in a threadpool
+            # Run yfinance blocking calls in a threadpool. A fresh Ticker is used here on purpose:
+            # fast_info memoises its prices per instance, so a shared one would serve stale quotes.
             ticker = await asyncio.to_thread(yf.Ticker, symbol)
             fast_info = await asyncio.to_thread(lambda: ticker.fast_info)
             last_price = fast_info.get("lastPrice")
@@ -64,7 +120,7 @@ class YfinanceAdapter(QuantitativeDataPort, TrendingDataPort, SearchDataPort, Pe
             Dict[str, Price]: A dictionary mapping "YYYY-MM" to Price objects.
         """
         try:
-            ticker = await asyncio.to_thread(yf.Ticker, symbol)
+            ticker = await self._get_ticker(symbol)
             hist = await asyncio.to_thread(ticker.history, period="10y", interval="1mo")
             
             if hist.empty:
@@ -93,7 +149,8 @@ class YfinanceAdapter(QuantitativeDataPort, TrendingDataPort, SearchDataPort, Pe
             Ticker: An object containing the ticker information.
         """
         try:
-            ticker = await asyncio.to_thread(yf.Ticker, symbol)
+            # info also carries the live quote (market cap, today's change), so it is only reused while fresh
+            ticker = await self._get_ticker(symbol, max_age=self.QUOTE_CACHE_TTL)
             info = await asyncio.to_thread(lambda: ticker.info)
             
             if not info or "symbol" not in info:
@@ -161,7 +218,7 @@ class YfinanceAdapter(QuantitativeDataPort, TrendingDataPort, SearchDataPort, Pe
             Dict[str, float]: Dictionary mapping shareholder name to their ownership percentage.
         """
         try:
-            ticker = await asyncio.to_thread(yf.Ticker, symbol)
+            ticker = await self._get_ticker(symbol)
             institutional_holders = await asyncio.to_thread(lambda: ticker.institutional_holders)
             
             if institutional_holders is None or institutional_holders.empty:
@@ -210,27 +267,27 @@ class YfinanceAdapter(QuantitativeDataPort, TrendingDataPort, SearchDataPort, Pe
         headers = {'User-Agent': 'Mozilla/5.0'}
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=headers, timeout=5.0)
-                
-                if response.status_code != 200:
-                    return []
-                    
-                data = response.json()
-                quotes = data.get("quotes", [])
+            client = self._search_client.get()
+            response = await client.get(url, headers=headers, timeout=5.0)
+            
+            if response.status_code != 200:
+                return []
                 
-                results = []
-                for quote in quotes:
-                    if quote.get("quoteType") == "EQUITY":
-                        results.append({
-                            "symbol": quote.get("symbol", ""),
-                            "name": quote.get("shortname", quote.get("longname", "")),
-                            "exchange": quote.get("exchDisp", "")
-                        })
-                        if len(results) >= 6:
-                            break
-                            
-                return results
+            data = response.json()
+            quotes = data.get("quotes", [])
+            
+            results = []
+            for quote in quotes:
+                if quote.get("quoteType") == "EQUITY":
+                    results.append({
+                        "symbol": quote.get("symbol", ""),
+                        "name": quote.get("shortname", quote.get("longname", "")),
+                        "exchange": quote.get("exchDisp", "")
+                    })
+                    if len(results) >= 6:
+                        break
+                        
+            return results
         except Exception:
             return []
 
@@ -245,7 +302,7 @@ class YfinanceAdapter(QuantitativeDataPort, TrendingDataPort, SearchDataPort, Pe
             List[FinancialYear]: A list of FinancialYear objects containing the financial data for each year
         """
         try:
-            ticker = await asyncio.to_thread(yf.Ticker, symbol)
+            ticker = await self._get_ticker(symbol)
             
             # Fetch all needed statements
             financials = await asyncio.to_thread(lambda: ticker.financials)
@@ -276,6 +333,7 @@ class YfinanceAdapter(QuantitativeDataPort, TrendingDataPort, SearchDataPort, Pe
                 )
                 if period_data:
                     years_data.append(period_data)
+            ttm_year = None
             latest_annual_date = financials.columns[0] if not financials.empty else None
             latest_quarterly_date = quarterly_financials.columns[0] if not quarterly_financials.empty else None
 
@@ -284,93 +342,99 @@ class YfinanceAdapter(QuantitativeDataPort, TrendingDataPort, SearchDataPort, Pe
                     q_dates = quarterly_financials.columns[:4]
                     q_cf_dates = quarterly_cashflow.columns[:4]
 
-                    def get_ttm_val(df, dates, key):
-                        if df.empty or key not in df.index:
-                            return Decimal("0")
-                        total = Decimal("0")
-                        for d in dates:
-                            if d in df.columns:
-                                val = df.loc[key, d]
-                                if not pd.isna(val):
-                                    total += Decimal(str(val))
-                        return total
+                    def ttm_sums(df, dates) -> dict:
+                        # One pass over the trailing quarters sums every line item, instead of a .loc probe per key
+                        if df.empty:
+                            return {}
+                        window = df[[d for d in dates if d in df.columns]]
+                        return {
+                            key: sum(map(to_decimal, row), _ZERO)
+                            for key, row in zip(window.index, window.itertuples(index=False, name=None))
+                        }
+
+                    def latest_column(df) -> dict:
+                        if df.empty:
+                            return {}
+                        return df[df.columns[0]].to_dict()
+
+                    financials_ttm = ttm_sums(quarterly_financials, q_dates)
+                    cashflow_ttm = ttm_sums(quarterly_cashflow, q_cf_dates)
+                    latest_financials = latest_column(quarterly_financials)
+                    latest_balance_sheet = latest_column(quarterly_balance_sheet)
+
+                    def get_ttm_val(sums, key):
+                        return sums.get(key, _ZERO)
                     
-                    def get_latest_q_val(df, key):
-                        if df.empty or key not in df.index:
-                            return Decimal("0")
-                        d = df.columns[0]
-                        val = df.loc[key, d]
-                        if pd.isna(val):
-                            return Decimal("0")
-                        return Decimal(str(val))
+                    def get_latest_q_val(col, key):
+                        return to_decimal(col.get(key))
 
-                    ttm_revenue = get_ttm_val(quarterly_financials, q_dates, 'Total Revenue')
-                    if ttm_revenue > Decimal("0"):
-                        ttm_gross_profit = get_ttm_val(quarterly_financials, q_dates, 'Gross Profit')
-                        if ttm_gross_profit == Decimal("0"):
+                    ttm_revenue = get_ttm_val(financials_ttm, 'Total Revenue')
+                    if ttm_revenue > _ZERO:
+                        ttm_gross_profit = get_ttm_val(financials_ttm, 'Gross Profit')
+                        if ttm_gross_profit == _ZERO:
                             ttm_gross_profit = ttm_revenue
                         
-                        ttm_operating_income = get_ttm_val(quarterly_financials, q_dates, 'Operating Income')
-                        if ttm_operating_income == Decimal("0"):
-                            ttm_operating_income = get_ttm_val(quarterly_financials, q_dates, 'Pretax Income')
+                        ttm_operating_income = get_ttm_val(financials_ttm, 'Operating Income')
+                        if ttm_operating_income == _ZERO:
+                            ttm_operating_income = get_ttm_val(financials_ttm, 'Pretax Income')
                         
-                        ttm_net_income = get_ttm_val(quarterly_financials, q_dates, 'Net Income')
-                        if ttm_net_income == Decimal("0"):
-                            ttm_net_income = get_ttm_val(quarterly_financials, q_dates, 'Net Income Common Stockholders')
+                        ttm_net_income = get_ttm_val(financials_ttm, 'Net Income')
+                        if ttm_net_income == _ZERO:
+                            ttm_net_income = get_ttm_val(financials_ttm, 'Net Income Common Stockholders')
                             
-                        ttm_research_and_development = get_ttm_val(quarterly_financials, q_dates, 'Research And Development')
-                        ttm_selling_general_and_administrative = get_ttm_val(quarterly_financials, q_dates, 'Selling General And Administration')
+                        ttm_research_and_development = get_ttm_val(financials_ttm, 'Research And Development')
+                        ttm_selling_general_and_administrative = get_ttm_val(financials_ttm, 'Selling General And Administration')
 
-                        ttm_ebitda = get_ttm_val(quarterly_financials, q_dates, 'EBITDA')
-                        if ttm_ebitda == Decimal("0"):
-                            ttm_ebitda = ttm_operating_income + get_ttm_val(quarterly_cashflow, q_cf_dates, 'Depreciation And Amortization')
+                        ttm_ebitda = get_ttm_val(financials_ttm, 'EBITDA')
+                        if ttm_ebitda == _ZERO:
+                            ttm_ebitda = ttm_operating_income + get_ttm_val(cashflow_ttm, 'Depreciation And Amortization')
                         
-                        ttm_operating_cash_flow = get_ttm_val(quarterly_cashflow, q_cf_dates, 'Operating Cash Flow')
-                        ttm_depreciation_and_amortization = get_ttm_val(quarterly_cashflow, q_cf_dates, 'Depreciation And Amortization')
-                        ttm_stock_based_compensation = get_ttm_val(quarterly_cashflow, q_cf_dates, 'Stock Based Compensation')
-                        ttm_capital_expenditures = get_ttm_val(quarterly_cashflow, q_cf_dates, 'Capital Expenditure')
-                        ttm_net_investing_cash_flow = get_ttm_val(quarterly_cashflow, q_cf_dates, 'Investing Cash Flow')
-                        ttm_dividends_paid = get_ttm_val(quarterly_cashflow, q_cf_dates, 'Cash Dividends Paid')
-                        ttm_stock_repurchases = get_ttm_val(quarterly_cashflow, q_cf_dates, 'Repurchase Of Capital Stock')
-                        ttm_net_debt_issued = get_ttm_val(quarterly_cashflow, q_cf_dates, 'Net Issuance Payments Of Debt')
-                        ttm_net_financing_cash_flow = get_ttm_val(quarterly_cashflow, q_cf_dates, 'Financing Cash Flow')
+                        ttm_operating_cash_flow = get_ttm_val(cashflow_ttm, 'Operating Cash Flow')
+                        ttm_depreciation_and_amortization = get_ttm_val(cashflow_ttm, 'Depreciation And Amortization')
+                        ttm_stock_based_compensation = get_ttm_val(cashflow_ttm, 'Stock Based Compensation')
+                        ttm_capital_expenditures = get_ttm_val(cashflow_ttm, 'Capital Expenditure')
+                        ttm_net_investing_cash_flow = get_ttm_val(cashflow_ttm, 'Investing Cash Flow')
+                        ttm_dividends_paid = get_ttm_val(cashflow_ttm, 'Cash Dividends Paid')
+                        ttm_stock_repurchases = get_ttm_val(cashflow_ttm, 'Repurchase Of Capital Stock')
+                        ttm_net_debt_issued = get_ttm_val(cashflow_ttm, 'Net Issuance Payments Of Debt')
+                        ttm_net_financing_cash_flow = get_ttm_val(cashflow_ttm, 'Financing Cash Flow')
                         
-                        ttm_total_assets = get_latest_q_val(quarterly_balance_sheet, 'Total Assets')
-                        ttm_total_liabilities = get_latest_q_val(quarterly_balance_sheet, 'Total Liabilities Net Minority Interest')
-                        ttm_total_debt = get_latest_q_val(quarterly_balance_sheet, 'Total Debt')
-                        ttm_short_term_debt = get_latest_q_val(quarterly_balance_sheet, 'Current Debt')
-                        ttm_long_term_debt = get_latest_q_val(quarterly_balance_sheet, 'Long Term Debt')
-                        ttm_cash_and_equivalents = get_latest_q_val(quarterly_balance_sheet, 'Cash And Cash Equivalents')
+                        ttm_total_assets = get_latest_q_val(latest_balance_sheet, 'Total Assets')
+                        ttm_total_liabilities = get_latest_q_val(latest_balance_sheet, 'Total Liabilities Net Minority Interest')
+                        ttm_total_debt = get_latest_q_val(latest_balance_sheet, 'Total Debt')
+                        ttm_short_term_debt = get_latest_q_val(latest_balance_sheet, 'Current Debt')
+                        ttm_long_term_debt = get_latest_q_val(latest_balance_sheet, 'Long Term Debt')
+                        ttm_cash_and_equivalents = get_latest_q_val(latest_balance_sheet, 'Cash And Cash Equivalents')
                         
-                        ttm_accounts_payable = get_latest_q_val(quarterly_balance_sheet, 'Accounts Payable')
-                        if ttm_accounts_payable == Decimal("0"):
-                            ttm_accounts_payable = get_latest_q_val(quarterly_balance_sheet, 'Payables')
-                        ttm_current_liabilities = get_latest_q_val(quarterly_balance_sheet, 'Current Liabilities')
+                        ttm_accounts_payable = get_latest_q_val(latest_balance_sheet, 'Accounts Payable')
+                        if ttm_accounts_payable == _ZERO:
+                            ttm_accounts_payable = get_latest_q_val(latest_balance_sheet, 'Payables')
+                        ttm_current_liabilities = get_latest_q_val(latest_balance_sheet, 'Current Liabilities')
                         
-                        ttm_accounts_receivable = get_latest_q_val(quarterly_balance_sheet, 'Accounts Receivable')
-                        if ttm_accounts_receivable == Decimal("0"):
-                            ttm_accounts_receivable = get_latest_q_val(quarterly_balance_sheet, 'Receivables')
-                        ttm_inventory = get_latest_q_val(quarterly_balance_sheet, 'Inventory')
-                        ttm_current_assets = get_latest_q_val(quarterly_balance_sheet, 'Current Assets')
-                        ttm_net_ppe = get_latest_q_val(quarterly_balance_sheet, 'Net PPE')
+                        ttm_accounts_receivable = get_latest_q_val(latest_balance_sheet, 'Accounts Receivable')
+                        if ttm_accounts_receivable == _ZERO:
+                            ttm_accounts_receivable = get_latest_q_val(latest_balance_sheet, 'Receivables')
+                        ttm_inventory = get_latest_q_val(latest_balance_sheet, 'Inventory')
+                        ttm_current_assets = get_latest_q_val(latest_balance_sheet, 'Current Assets')
+                        ttm_net_ppe = get_latest_q_val(latest_balance_sheet, 'Net PPE')
                         
-                        ttm_intangible_assets = get_latest_q_val(quarterly_balance_sheet, 'Goodwill And Other Intangible Assets')
-                        if ttm_intangible_assets == Decimal("0"):
-                            ttm_intangible_assets = get_latest_q_val(quarterly_balance_sheet, 'Other Intangible Assets') + get_latest_q_val(quarterly_balance_sheet, 'Goodwill')
+                        ttm_intangible_assets = get_latest_q_val(latest_balance_sheet, 'Goodwill And Other Intangible Assets')
+                        if ttm_intangible_assets == _ZERO:
+                            ttm_intangible_assets = get_latest_q_val(latest_balance_sheet, 'Other Intangible Assets') + get_latest_q_val(latest_balance_sheet, 'Goodwill')
                         
-                        ttm_shares_outstanding = get_latest_q_val(quarterly_financials, 'Basic Average Shares')
-                        if ttm_shares_outstanding == Decimal("0"):
-                            ttm_shares_outstanding = get_latest_q_val(quarterly_financials, 'Diluted Average Shares')
+                        ttm_shares_outstanding = get_latest_q_val(latest_financials, 'Basic Average Shares')
+                        if ttm_shares_outstanding == _ZERO:
+                            ttm_shares_outstanding = get_latest_q_val(latest_financials, 'Diluted Average Shares')
                         
-                        ttm_interest_expense = get_ttm_val(quarterly_financials, q_dates, 'Interest Expense')
-                        ttm_income_tax_expense = get_ttm_val(quarterly_financials, q_dates, 'Tax Provision')
-                        ttm_income_before_tax = get_ttm_val(quarterly_financials, q_dates, 'Pretax Income')
+                        ttm_interest_expense = get_ttm_val(financials_ttm, 'Interest Expense')
+                        ttm_income_tax_expense = get_ttm_val(financials_ttm, 'Tax Provision')
+                        ttm_income_before_tax = get_ttm_val(financials_ttm, 'Pretax Income')
                         
-                        ttm_shares_outstanding = max(ttm_shares_outstanding, Decimal("0"))
-                        ttm_total_assets = max(ttm_total_assets, Decimal("0"))
-                        ttm_total_debt = max(ttm_total_debt, Decimal("0"))
+                        ttm_shares_outstanding = max(ttm_shares_outstanding, _ZERO)
+                        ttm_total_assets = max(ttm_total_assets, _ZERO)
+                        ttm_total_debt = max(ttm_total_debt, _ZERO)
 
-                        years_data.append(FinancialYear(
+                        ttm_year = FinancialYear(
                             fiscal_date_ending="TTM",
                             revenue=ttm_revenue,
                             ebitda=ttm_ebitda,
@@ -405,15 +469,15 @@ class YfinanceAdapter(QuantitativeDataPort, TrendingDataPort, SearchDataPort, Pe
                             interest_expense=ttm_interest_expense,
                             income_tax_expense=ttm_income_tax_expense,
                             income_before_tax=ttm_income_before_tax,
-                            year_end_price=Decimal("0")
-                        ))
+                            year_end_price=_ZERO
+                        )
             
-            sorted_years = sorted([y for y in years_data if y.fiscal_date_ending != "TTM"], key=lambda x: x.fiscal_date_ending)
-            ttm_year = next((y for y in years_data if y.fiscal_date_ending == "TTM"), None)
+            # years_data only holds annual periods, so it is sorted in place and the TTM row (if any) goes last
+            years_data.sort(key=lambda x: x.fiscal_date_ending)
             if ttm_year:
-                sorted_years.append(ttm_year)
+                years_data.append(ttm_year)
                 
-            return sorted_years
+            return years_data
         except Exception as e:
             raise DataFetchError(f"Failed to fetch fundamental data from yfinance: {str(e)}")
 
@@ -428,7 +492,7 @@ class YfinanceAdapter(QuantitativeDataPort, TrendingDataPort, SearchDataPort, Pe
             List[FinancialQuarter]: A list of FinancialQuarter objects containing the financial data for each quarter
         """
         try:
-            ticker = await asyncio.to_thread(yf.Ticker, symbol)
+            ticker = await self._get_ticker(symbol)
             
             # Fetch all needed statements
             financials = await asyncio.to_thread(lambda: ticker.quarterly_financials)
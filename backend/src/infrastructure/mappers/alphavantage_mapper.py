@@ -1,8 +1,28 @@
+import logging
 from decimal import Decimal, InvalidOperation
 from typing import List, Dict, Any
 
 from domain.entities import FinancialQuarter, FinancialYear, Price
 
+logger = logging.getLogger(__name__)
+
+_ZERO = Decimal("0")
+
+# Every statement row builds ~25 Decimals; the pure-Python fallback is an order of magnitude slower.
+try:
+    import _decimal
+    _C_DECIMAL = Decimal is _decimal.Decimal
+except ImportError:
+    _C_DECIMAL = False
+
+def warn_if_pure_python_decimal():
+    """
+    Logs a warning when decimal is backed by _pydecimal instead of the C implementation.
+    Called once at application startup rather than as a side effect of importing the mapper.
+    """
+    if not _C_DECIMAL:
+        logger.warning("C-accelerated decimal module unavailable; Alpha Vantage mapping will run on _pydecimal.")
+
 def parse_decimal(value: Any, field_name: str) -> Decimal:
         """
         Safely parses a string value to Decimal.
@@ -16,12 +36,64 @@ def parse_decimal(value: Any, field_name: str) -> Decimal:
             Decimal: The parsed decimal value, or 0 if the input is invalid.
         """
         if value is None or value == "None" or value == "":
-            return Decimal("0")
+            return _ZERO
         try:
             return Decimal(value)
         except (InvalidOperation, TypeError, ValueError):
             raise ValueError(f"Data Integrity Error: Could not parse field '{field_name}' with value '{value}' to Decimal.")
 
+# (entity attribute, Alpha Vantage report key) pairs shared by the yearly and quarterly mappers.
+_INCOME_FIELDS = (
+    ("revenue", "totalRevenue"),
+    ("ebitda", "ebitda"),
+    ("gross_profit", "grossProfit"),
+    ("operating_income", "operatingIncome"),
+    ("net_income", "netIncome"),
+)
+
+_CASH_FIELDS = (
+    ("operating_cash_flow", "operatingCashflow"),
+    ("depreciation_and_amortization", "depreciationDepletionAndAmortization"),
+    ("capital_expenditures", "capitalExpenditures"),
+    ("net_investing_cash_flow", "cashflowFromInvestment"),
+    ("dividends_paid", "dividendPayout"),
+    ("net_financing_cash_flow", "cashflowFromFinancing"),
+)
+
+_BALANCE_FIELDS = (
+    ("shares_outstanding", "commonStockSharesOutstanding"),
+    ("short_term_debt", "shortTermDebt"),
+    ("long_term_debt", "longTermDebt"),
+    ("total_assets", "totalAssets"),
+    ("total_liabilities", "totalLiabilities"),
+    ("cash_and_equivalents", "cashAndCashEquivalentsAtCarryingValue"),
+    ("accounts_payable", "currentAccountsPayable"),
+    ("current_liabilities", "totalCurrentLiabilities"),
+    ("accounts_receivable", "currentNetReceivables"),
+    ("inventory", "inventory"),
+    ("current_assets", "totalCurrentAssets"),
+    ("net_ppe", "propertyPlantEquipment"),
+    ("intangible_assets", "intangibleAssets"),
+)
+
+def _parse_report_fields(income_report: Dict[str, Any], balance_report: Dict[str, Any], cash_report: Dict[str, Any]) -> Dict[str, Decimal]:
+        """
+        Parses every mapped field of the three statements for one fiscal period in a single pass.
+
+        Args:
+            income_report (Dict): Income Statement report for the period.
+            balance_report (Dict): Balance Sheet report for the period.
+            cash_report (Dict): Cash Flow Statement report for the period.
+
+        Returns:
+            Dict[str, Decimal]: Entity keyword arguments, including the derived total_debt.
+        """
+        fields = {attr: parse_decimal(income_report.get(key), key) for attr, key in _INCOME_FIELDS}
+        fields.update({attr: parse_decimal(cash_report.get(key), key) for attr, key in _CASH_FIELDS})
+        fields.update({attr: parse_decimal(balance_report.get(key), key) for attr, key in _BALANCE_FIELDS})
+        fields["total_debt"] = fields["short_term_debt"] + fields["long_term_debt"]
+        return fields
+
 def map_to_financial_years(income_list: List[Dict[str, Any]], balance_list: List[Dict[str, Any]], cash_list: List[Dict[str, Any]], historical_prices: Dict[str, Price]) -> List[FinancialYear]:
         """
         Merges financial reports from three different accounting statements based on their fiscal ending date.
@@ -59,57 +131,11 @@ def map_to_financial_years(income_list: List[Dict[str, Any]], balance_list: List
                 
             year_month = fiscal_date[:7]
             price_obj = historical_prices.get(year_month)
-            year_end_price = price_obj.amount if price_obj else Decimal("0")
+            year_end_price = price_obj.amount if price_obj else _ZERO
             
             year_data = FinancialYear(
                 fiscal_date_ending=fiscal_date,
-                
-                # Revenue and Earnings
-                revenue=parse_decimal(income_report.get("totalRevenue", "0"), "totalRevenue"),
-                ebitda=parse_decimal(income_report.get("ebitda", "0"), "ebitda"),
-                
-                # Gross Profit and Operating Income
-                gross_profit=parse_decimal(income_report.get("grossProfit", "0"), "grossProfit"),
-                operating_income=parse_decimal(income_report.get("operatingIncome", "0"), "operatingIncome"),
-                
-                # Net Income
-                net_income=parse_decimal(income_report.get("netIncome", "0"), "netIncome"),
-                
-                # Cash Flow
-                operating_cash_flow=parse_decimal(cash_report.get("operatingCashflow", "0"), "operatingCashflow"),
-                depreciation_and_amortization=parse_decimal(cash_report.get("depreciationDepletionAndAmortization", "0"), "depreciationDepletionAndAmortization"),
-                capital_expenditures=parse_decimal(cash_report.get("capitalExpenditures", "0"), "capitalExpenditures"),
-                net_investing_cash_flow=parse_decimal(cash_report.get("cashflowFromInvestment", "0"), "cashflowFromInvestment"),
-                dividends_paid=parse_decimal(cash_report.get("dividendPayout", "0"), "dividendPayout"),
-                net_financing_cash_flow=parse_decimal(cash_report.get("cashflowFromFinancing", "0"), "cashflowFromFinancing"),
-                
-                # Shares Outstanding
-                shares_outstanding=parse_decimal(balance_report.get("commonStockSharesOutstanding", "0"), "commonStockSharesOutstanding"),
-                
-                # Debt
-                short_term_debt=parse_decimal(balance_report.get("shortTermDebt", "0"), "shortTermDebt"),
-                long_term_debt=parse_decimal(balance_report.get("longTermDebt", "0"), "longTermDebt"),
-                
-                # Total Debt
-                total_debt=(
-                    parse_decimal(balance_report.get("shortTermDebt", "0"), "shortTermDebt") + 
-                    parse_decimal(balance_report.get("longTermDebt", "0"), "longTermDebt")
-                ),
-                
-                # Assets and Liabilities
-                total_assets=parse_decimal(balance_report.get("totalAssets", "0"), "totalAssets"),
-                total_liabilities=parse_decimal(balance_report.get("totalLiabilities", "0"), "totalLiabilities"),
-                cash_and_equivalents=parse_decimal(balance_report.get("cashAndCashEquivalentsAtCarryingValue", "0"), "cashAndCashEquivalentsAtCarryingValue"),
-                
-                accounts_payable=parse_decimal(balance_report.get("currentAccountsPayable", "0"), "currentAccountsPayable"),
-                current_liabilities=parse_decimal(balance_report.get("totalCurrentLiabilities", "0"), "totalCurrentLiabilities"),
-                accounts_receivable=parse_decimal(balance_report.get("currentNetReceivables", "0"), "currentNetReceivables"),
-                inventory=parse_decimal(balance_report.get("inventory", "0"), "inventory"),
-                current_assets=parse_decimal(balance_report.get("totalCurrentAssets", "0"), "totalCurrentAssets"),
-                net_ppe=parse_decimal(balance_report.get("propertyPlantEquipment", "0"), "propertyPlantEquipment"),
-                intangible_assets=parse_decimal(balance_report.get("intangibleAssets", "0"), "intangibleAssets"),
-                
-                # Market Price at Year End
+                **_parse_report_fields(income_report, balance_report, cash_report),
                 year_end_price=year_end_price
             )
             
@@ -144,40 +170,13 @@ def map_to_financial_quarters(income_list: List[Dict[str, Any]], balance_list: L
                 continue
                 
             year_month = date_ending[:7]
-            year_end_price = Decimal("0")
+            year_end_price = _ZERO
             if year_month in historical_prices:
                 year_end_price = historical_prices[year_month].amount
 
             quarter_data = FinancialQuarter(
                 fiscal_date_ending=date_ending,
-                revenue=parse_decimal(income_report.get("totalRevenue", "0"), "totalRevenue"),
-                ebitda=parse_decimal(income_report.get("ebitda", "0"), "ebitda"),
-                gross_profit=parse_decimal(income_report.get("grossProfit", "0"), "grossProfit"),
-                operating_income=parse_decimal(income_report.get("operatingIncome", "0"), "operatingIncome"),
-                net_income=parse_decimal(income_report.get("netIncome", "0"), "netIncome"),
-                operating_cash_flow=parse_decimal(cash_report.get("operatingCashflow", "0"), "operatingCashflow"),
-                depreciation_and_amortization=parse_decimal(cash_report.get("depreciationDepletionAndAmortization", "0"), "depreciationDepletionAndAmortization"),
-                capital_expenditures=parse_decimal(cash_report.get("capitalExpenditures", "0"), "capitalExpenditures"),
-                net_investing_cash_flow=parse_decimal(cash_report.get("cashflowFromInvestment", "0"), "cashflowFromInvestment"),
-                dividends_paid=parse_decimal(cash_report.get("dividendPayout", "0"), "dividendPayout"),
-                net_financing_cash_flow=parse_decimal(cash_report.get("cashflowFromFinancing", "0"), "cashflowFromFinancing"),
-                shares_outstanding=parse_decimal(balance_report.get("commonStockSharesOutstanding", "0"), "commonStockSharesOutstanding"),
-                short_term_debt=parse_decimal(balance_report.get("shortTermDebt", "0"), "shortTermDebt"),
-                long_term_debt=parse_decimal(balance_report.get("longTermDebt", "0"), "longTermDebt"),
-                total_debt=(
-                    parse_decimal(balance_report.get("shortTermDebt", "0"), "shortTermDebt") + 
-                    parse_decimal(balance_report.get("longTermDebt", "0"), "longTermDebt")
-                ),
-                total_assets=parse_decimal(balance_report.get("totalAssets", "0"), "totalAssets"),
-                total_liabilities=parse_decimal(balance_report.get("totalLiabilities", "0"), "totalLiabilities"),
-                cash_and_equivalents=parse_decimal(balance_report.get("cashAndCashEquivalentsAtCarryingValue", "0"), "cashAndCashEquivalentsAtCarryingValue"),
-                accounts_payable=parse_decimal(balance_report.get("currentAccountsPayable", "0"), "currentAccountsPayable"),
-                current_liabilities=parse_decimal(balance_report.get("totalCurrentLiabilities", "0"), "totalCurrentLiabilities"),
-                accounts_receivable=parse_decimal(balance_report.get("currentNetReceivables", "0"), "currentNetReceivables"),
-                inventory=parse_decimal(balance_report.get("inventory", "0"), "inventory"),
-                current_assets=parse_decimal(balance_report.get("totalCurrentAssets", "0"), "totalCurrentAssets"),
-                net_ppe=parse_decimal(balance_report.get("propertyPlantEquipment", "0"), "propertyPlantEquipment"),
-                intangible_assets=parse_decimal(balance_report.get("intangibleAssets", "0"), "intangibleAssets"),
+                **_parse_report_fields(income_report, balance_report, cash_report),
                 quarter_end_price=year_end_price
             )
             
@@ -1,9 +1,37 @@
+import logging
 from decimal import Decimal
+import numpy as np
 import pandas as pd
 from typing import Optional
+from yfinance.exceptions import YFException
 
 from domain.entities import FinancialYear, FinancialQuarter
 
+logger = logging.getLogger(__name__)
+
+_ZERO = Decimal(0)
+
+def to_decimal(val) -> Decimal:
+    """
+    Converts a yfinance statement cell to Decimal, treating missing values (None/NaN/pd.NA) as zero.
+    Integer cells skip the float-to-string round-trip; floats keep the str() path so values stay exact.
+    
+    Args:
+        val: The raw cell value (int, float, numpy scalar or a pandas missing-value marker).
+        
+    Returns:
+        Decimal: The converted value, or 0 if the cell is missing.
+    """
+    if isinstance(val, (int, np.integer)):
+        return Decimal(int(val))
+    if isinstance(val, float): # includes np.float64; NaN is the only float not equal to itself
+        return _ZERO if val != val else Decimal(str(val))
+    # Nullable-dtype frames yield pd.NA, whose comparisons are NA rather than bool, so anything
+    # that is not a plain number goes through pandas' own missing-value check.
+    if val is None or pd.isna(val):
+        return _ZERO
+    return Decimal(str(val))
+
 def parse_financial_period(date_str: str, date, financials, balance_sheet, cashflow, ticker, is_quarter: bool = False):
     """
     Parses the financial data for a specific period (year or quarter) and returns a FinancialYear or FinancialQuarter object.
@@ -20,90 +48,96 @@ def parse_financial_period(date_str: str, date, financials, balance_sheet, cashf
     Returns:
         FinancialYear or FinancialQuarter: The parsed financial data object for the period.
     """
-    def get_val(df, key):
-        if df.empty or date not in df.columns or key not in df.index:
-            return Decimal("0")
-        val = df.loc[key, date]
-        if pd.isna(val):
-            return Decimal("0")
-        return Decimal(str(val))
+    def period_column(df) -> dict:
+        if df.empty or date not in df.columns:
+            return {}
+        return df[date].to_dict()
+
+    # Each statement's column for this period is materialised once; lookups are then plain dict probes
+    # instead of a DataFrame membership check plus .loc indexing per line item.
+    financials_col = period_column(financials)
+    balance_sheet_col = period_column(balance_sheet)
+    cashflow_col = period_column(cashflow)
+
+    def get_val(col, key):
+        return to_decimal(col.get(key))
         
-    revenue = get_val(financials, 'Total Revenue')
-    if revenue == Decimal("0"):
+    revenue = get_val(financials_col, 'Total Revenue')
+    if revenue == _ZERO:
         return None # Skip missing data
         
-    gross_profit = get_val(financials, 'Gross Profit')
-    if gross_profit == Decimal("0"):
-        interest_expense = get_val(financials, 'Interest Expense')
-        interest_income = get_val(financials, 'Interest Income')
-        if interest_expense > Decimal("0") and interest_income > Decimal("0"):
+    gross_profit = get_val(financials_col, 'Gross Profit')
+    if gross_profit == _ZERO:
+        interest_expense = get_val(financials_col, 'Interest Expense')
+        interest_income = get_val(financials_col, 'Interest Income')
+        if interest_expense > _ZERO and interest_income > _ZERO:
             gross_profit = revenue
             revenue = revenue + interest_expense
         else:
-            policy_benefits = get_val(financials, 'Net Policyholder Benefits And Claims')
-            if policy_benefits > Decimal("0"):
+            policy_benefits = get_val(financials_col, 'Net Policyholder Benefits And Claims')
+            if policy_benefits > _ZERO:
                 gross_profit = revenue - policy_benefits
             else:
                 gross_profit = revenue
                 
-    operating_income = get_val(financials, 'Operating Income')
-    if operating_income == Decimal("0"):
-        operating_income = get_val(financials, 'Pretax Income')
+    operating_income = get_val(financials_col, 'Operating Income')
+    if operating_income == _ZERO:
+        operating_income = get_val(financials_col, 'Pretax Income')
         
-    interest_expense_direct = get_val(financials, 'Interest Expense')
-    income_tax_expense = get_val(financials, 'Tax Provision')
-    income_before_tax = get_val(financials, 'Pretax Income')
+    interest_expense_direct = get_val(financials_col, 'Interest Expense')
+    income_tax_expense = get_val(financials_col, 'Tax Provision')
+    income_before_tax = get_val(financials_col, 'Pretax Income')
         
-    net_income = get_val(financials, 'Net Income')
-    if net_income == Decimal("0"):
-        net_income = get_val(financials, 'Net Income Common Stockholders')
-    if net_income == Decimal("0"):
-        net_income = get_val(financials, 'Net Income Including Noncontrolling Interests')
+    net_income = get_val(financials_col, 'Net Income')
+    if net_income == _ZERO:
+        net_income = get_val(financials_col, 'Net Income Common Stockholders')
+    if net_income == _ZERO:
+        net_income = get_val(financials_col, 'Net Income Including Noncontrolling Interests')
         
-    research_and_development = get_val(financials, 'Research And Development')
-    selling_general_and_administrative = get_val(financials, 'Selling General And Administration')
+    research_and_development = get_val(financials_col, 'Research And Development')
+    selling_general_and_administrative = get_val(financials_col, 'Selling General And Administration')
     
-    ebitda = get_val(financials, 'EBITDA')
-    if ebitda == Decimal("0"):
-        ebitda = operating_income + get_val(cashflow, 'Depreciation And Amortization')
-    shares_outstanding = get_val(financials, 'Basic Average Shares')
-    if shares_outstanding == Decimal("0"):
-        shares_outstanding = get_val(financials, 'Diluted Average Shares')
+    ebitda = get_val(financials_col, 'EBITDA')
+    if ebitda == _ZERO:
+        ebitda = operating_income + get_val(cashflow_col, 'Depreciation And Amortization')
+    shares_outstanding = get_val(financials_col, 'Basic Average Shares')
+    if shares_outstanding == _ZERO:
+        shares_outstanding = get_val(financials_col, 'Diluted Average Shares')
     
-    total_assets = get_val(balance_sheet, 'Total Assets')
-    total_liabilities = get_val(balance_sheet, 'Total Liabilities Net Minority Interest')
-    total_debt = get_val(balance_sheet, 'Total Debt')
-    short_term_debt = get_val(balance_sheet, 'Current Debt')
-    long_term_debt = get_val(balance_sheet, 'Long Term Debt')
-    cash_and_equivalents = get_val(balance_sheet, 'Cash And Cash Equivalents')
+    total_assets = get_val(balance_sheet_col, 'Total Assets')
+    total_liabilities = get_val(balance_sheet_col, 'Total Liabilities Net Minority Interest')
+    total_debt = get_val(balance_sheet_col, 'Total Debt')
+    short_term_debt = get_val(balance_sheet_col, 'Current Debt')
+    long_term_debt = get_val(balance_sheet_col, 'Long Term Debt')
+    cash_and_equivalents = get_val(balance_sheet_col, 'Cash And Cash Equivalents')
     
-    accounts_payable = get_val(balance_sheet, 'Accounts Payable')
-    if accounts_payable == Decimal("0"):
-        accounts_payable = get_val(balance_sheet, 'Payables')
-    current_liabilities = get_val(balance_sheet, 'Current Liabilities')
+    accounts_payable = get_val(balance_sheet_col, 'Accounts Payable')
+    if accounts_payable == _ZERO:
+        accounts_payable = get_val(balance_sheet_col, 'Payables')
+    current_liabilities = get_val(balance_sheet_col, 'Current Liabilities')
     
-    accounts_receivable = get_val(balance_sheet, 'Accounts Receivable')
-    if accounts_receivable == Decimal("0"):
-        accounts_receivable = get_val(balance_sheet, 'Receivables')
-    inventory = get_val(balance_sheet, 'Inventory')
-    current_assets = get_val(balance_sheet, 'Current Assets')
-    net_ppe = get_val(balance_sheet, 'Net PPE')
+    accounts_receivable = get_val(balance_sheet_col, 'Accounts Receivable')
+    if accounts_receivable == _ZERO:
+        accounts_receivable = get_val(balance_sheet_col, 'Receivables')
+    inventory = get_val(balance_sheet_col, 'Inventory')
+    current_assets = get_val(balance_sheet_col, 'Current Assets')
+    net_ppe = get_val(balance_sheet_col, 'Net PPE')
     
-    intangible_assets = get_val(balance_sheet, 'Goodwill And Other Intangible Assets')
-    if intangible_assets == Decimal("0"):
-        intangible_assets = get_val(balance_sheet, 'Other Intangible Assets') + get_val(balance_sheet, 'Goodwill')
+    intangible_assets = get_val(balance_sheet_col, 'Goodwill And Other Intangible Assets')
+    if intangible_assets == _ZERO:
+        intangible_assets = get_val(balance_sheet_col, 'Other Intangible Assets') + get_val(balance_sheet_col, 'Goodwill')
     
-    operating_cash_flow = get_val(cashflow, 'Operating Cash Flow')
-    depreciation_and_amortization = get_val(cashflow, 'Depreciation And Amortization')
-    stock_based_compensation = get_val(cashflow, 'Stock Based Compensation')
-    capital_expenditures = get_val(cashflow, 'Capital Expenditure')
-    net_investing_cash_flow = get_val(cashflow, 'Investing Cash Flow')
-    dividends_paid = get_val(cashflow, 'Cash Dividends Paid')
-    stock_repurchases = get_val(cashflow, 'Repurchase Of Capital Stock')
-    net_debt_issued = get_val(cashflow, 'Net Issuance Payments Of Debt')
-    net_financing_cash_flow = get_val(cashflow, 'Financing Cash Flow')
+    operating_cash_flow = get_val(cashflow_col, 'Operating Cash Flow')
+    depreciation_and_amortization = get_val(cashflow_col, 'Depreciation And Amortization')
+    stock_based_compensation = get_val(cashflow_col, 'Stock Based Compensation')
+    capital_expenditures = get_val(cashflow_col, 'Capital Expenditure')
+    net_investing_cash_flow = get_val(cashflow_col, 'Investing Cash Flow')
+    dividends_paid = get_val(cashflow_col, 'Cash Dividends Paid')
+    stock_repurchases = get_val(cashflow_col, 'Repurchase Of Capital Stock')
+    net_debt_issued = get_val(cashflow_col, 'Net Issuance Payments Of Debt')
+    net_financing_cash_flow = get_val(cashflow_col, 'Financing Cash Flow')
     
-    period_end_price = Decimal("0")
+    period_end_price = _ZERO
     try:
         hist_start = date - pd.Timedelta(days=5)
         hist_end = date + pd.Timedelta(days=5)
@@ -112,15 +146,14 @@ def parse_financial_period(date_str: str, date, financials, balance_sheet, cashf
             comp_date = pd.to_datetime(date).tz_localize(None)
             valid_prices = price_hist[price_hist.index.tz_localize(None) <= comp_date]
             if not valid_prices.empty:
-                close_val = valid_prices.iloc[-1]['Close']
-                if pd.notna(close_val):
-                    period_end_price = Decimal(str(close_val))
-    except:
-        pass
+                period_end_price = to_decimal(valid_prices.iloc[-1]['Close'])
+    except (YFException, OSError, KeyError, ValueError) as e:
+        # yfinance errors, network failures (OSError subclasses) and a malformed price frame
+        logger.warning("Could not fetch period-end price for %s: %s", date_str, e)
 
-    shares_outstanding = max(shares_outstanding, Decimal("0"))
-    total_assets = max(total_assets, Decimal("0"))
-    total_debt = max(total_debt, Decimal("0"))
+    shares_outstanding = max(shares_outstanding, _ZERO)
+    total_assets = max(total_assets, _ZERO)
+    total_debt = max(total_debt, _ZERO)
 
     base_args = dict(
         fiscal_date_ending=date_str,
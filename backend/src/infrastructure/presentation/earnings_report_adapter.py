@@ -1,6 +1,10 @@
+import io
+import sys
 from application.use_cases.analyse_earnings_report import EarningsReportUseCase
 from application.dtos import EarningsReportResult
 
+_REPORT_SEP = "=" * 80
+
 class EarningsReportAdapter:
     """
     Controller responsible for orchestrating the earnings report valuation process performing analysis using the EarningsReportUseCase.
@@ -22,51 +26,69 @@ class EarningsReportAdapter:
             ticker_symbol (str): The stock ticker symbol to analyse.
             pdf_file_path (str): The path to the PDF file.
         """
+        sys.stdout.write(await self.render(ticker_symbol, pdf_file_path))
+        sys.stdout.flush()
+
+    async def render(self, ticker_symbol: str, pdf_file_path: str) -> str:
+        """
+        Runs the earnings report analysis and returns the formatted report without printing it.
+        
+        Args:
+            ticker_symbol (str): The stock ticker symbol to analyse.
+            pdf_file_path (str): The path to the PDF file.
+            
+        Returns:
+            str: The report text, or the error message if the analysis failed.
+        """
+        out = io.StringIO()
         try:
             dto = await self.service.analyse_earnings_report(ticker_symbol, pdf_file_path)
-            self._display_results(dto)
+            self._display_results(dto, out)
         except Exception as e:
-            print(f"Error analyzing earnings report: {e}")
+            return f"Error analyzing earnings report: {e}\n"
+        
+        return out.getvalue()
 
-    def _display_results(self, result: EarningsReportResult):
+    def _display_results(self, result: EarningsReportResult, out: io.StringIO):
         """
-        Nicely formats and prints the earnings report valuation results to the console.
+        Nicely formats the earnings report valuation results into the report buffer.
         
         Args:
             result (EarningsReportResult): The result of the earnings report analysis to display.
+            out (io.StringIO): The report buffer the results are written to.
         """
-        print(f"\n{'='*80}")
-        print(f"VALUE INVESTING EARNINGS ANALYSIS: {result.ticker.name} ({result.ticker.symbol})")
-        print(f"Period Ended: {result.period_end_date}")
-        print(f"{'='*80}")
+        print(f"\n{_REPORT_SEP}", file=out)
+        print(f"VALUE INVESTING EARNINGS ANALYSIS: {result.ticker.name} ({result.ticker.symbol})", file=out)
+        print(f"Period Ended: {result.period_end_date}", file=out)
+        print(_REPORT_SEP, file=out)
         
-        print(f"\n[1] CORE PERFORMANCE (Non-GAAP):")
-        print(f"  - Adjusted Revenue: {result.core_performance.adjusted_revenue.amount:,.2f}")
-        print(f"  - Adjusted EPS: {result.core_performance.adjusted_eps.amount:,.2f}")
+        print(f"\n[1] CORE PERFORMANCE (Non-GAAP):", file=out)
+        print(f"  - Adjusted Revenue: {result.core_performance.adjusted_revenue.amount:,.2f}", file=out)
+        print(f"  - Adjusted EPS: {result.core_performance.adjusted_eps.amount:,.2f}", file=out)
 
-        print(f"  - Free Cash Flow: {result.core_performance.free_cash_flow.amount:,.2f}")
+        print(f"  - Free Cash Flow: {result.core_performance.free_cash_flow.amount:,.2f}", file=out)
         
-        print(f"\n[2] CAPITAL ALLOCATION:")
-        print(f"  - Share Buybacks: {result.capital_allocation.share_buybacks:,.2f}")
-        print(f"  - Dividends: {result.capital_allocation.dividends:,.2f}")
-        print(f"  - CapEx/R&D: {result.capital_allocation.capex_rd:,.2f}")
-        print(f"  - Infrastructure Assessment: {result.capital_allocation.infrastructure_assessment}")
+        print(f"\n[2] CAPITAL ALLOCATION:", file=out)
+        print(f"  - Share Buybacks: {result.capital_allocation.share_buybacks:,.2f}", file=out)
+        print(f"  - Dividends: {result.capital_allocation.dividends:,.2f}", file=out)
+        print(f"  - CapEx/R&D: {result.capital_allocation.capex_rd:,.2f}", file=out)
+        print(f"  - Infrastructure Assessment: {result.capital_allocation.infrastructure_assessment}", file=out)
         
-        print(f"\n[3] FORWARD GUIDANCE:")
-        print(f"  {result.forward_guidance}")
+        print(f"\n[3] FORWARD GUIDANCE:", file=out)
+        print(f"  {result.forward_guidance}", file=out)
         
-        print(f"\n[4] MOAT TRAJECTORY:")
-        print(f"  {result.moat_trajectory}")
+        print(f"\n[4] MOAT TRAJECTORY:", file=out)
+        print(f"  {result.moat_trajectory}", file=out)
         
-        print(f"\n[5] RISK DECONSTRUCTION:")
-        print(f"  External/Macro Risks:")
+        print(f"\n[5] RISK DECONSTRUCTION:", file=out)
+        print(f"  External/Macro Risks:", file=out)
         for r in result.risk_deconstruction.macro_risks:
-            print(f"   - {r}")
-        print(f"  Internal/Execution Risks:")
+            print(f"   - {r}", file=out)
+        print(f"  Internal/Execution Risks:", file=out)
         for r in result.risk_deconstruction.internal_risks:
-            print(f"   - {r}")
+            print(f"   - {r}", file=out)
             
-        print(f"\n[!] THE BOTTOM LINE:")
-        print(f"  {result.bottom_line}")
+        print(f"\n[!] THE BOTTOM LINE:", file=out)
+        print(f"  {result.bottom_line}", file=out)
         
-        print(f"\n{'='*80}\n")
\ No newline at end of file
+        print(f"\n{_REPORT_SEP}\n", file=out)
\ No newline at end of file
@@ -1,6 +1,10 @@
+import io
+import sys
 from application.use_cases.analyse_qualitative_valuation import QualitativeValuationUseCase
 from application.dtos import QualitativeValuationResult
 
+_REPORT_SEP = "=" * 60
+
 class QualitativeValuationAdapter:
     """
     Controller responsible for orchestrating the stock qualitative valuation process, including fetching data from the Adapter and performing analysis using the QualitativeValuationUseCase.
@@ -22,61 +26,78 @@ class QualitativeValuationAdapter:
             ticker_symbol (str): The stock ticker symbol to analyse.
 
         Returns:
-            None: This method creates the QualitativeValuationResult.
+            None: This method prints the rendered report to the console.
+        """
+        sys.stdout.write(await self.render(ticker_symbol))
+        sys.stdout.flush()
+
+    async def render(self, ticker_symbol: str) -> str:
+        """
+        Runs the qualitative valuation for a ticker and returns the formatted report without printing it.
+
+        Args:
+            ticker_symbol (str): The stock ticker symbol to analyse.
+
+        Returns:
+            str: The report text, or the error message if the analysis failed.
         """
+        out = io.StringIO()
         try:
             analysis_dto = await self.service.analyse_ticker(ticker_symbol)
 
-            self._display_qualitative_report(analysis_dto)
+            self._display_qualitative_report(analysis_dto, out)
 
         except Exception as e:
-            print(f"Qualitative analysis error: {e}")
+            return f"Qualitative analysis error: {e}\n"
+        
+        return out.getvalue()
 
-    def _display_qualitative_report(self, analysis: QualitativeValuationResult):
+    def _display_qualitative_report(self, analysis: QualitativeValuationResult, out: io.StringIO):
         """
-        Nicely formats and prints the qualitative valuation results to the console.
+        Nicely formats the qualitative valuation results into the report buffer.
 
         Args:
             analysis (QualitativeValuationResult): The result of the qualitative valuation analysis to display.
+            out (io.StringIO): The report buffer the results are written to.
 
         Returns:
-            None: This method prints the results directly to the console.
+            None: This method writes the results into the buffer.
         """
-        print(f"\n{'='*60}")
-        print(f"QUALITATIVE ANALYSIS: {analysis.ticker.name}")
-        print(f"{'='*60}")
+        print(f"\n{_REPORT_SEP}", file=out)
+        print(f"QUALITATIVE ANALYSIS: {analysis.ticker.name}", file=out)
+        print(_REPORT_SEP, file=out)
         
-        print(f"\nGENERAL DESCRIPTION AND HISTORY:")
-        print(f"   - Business: {analysis.business_description}")
-        print(f"   - Evolution: {analysis.company_history}")
+        print(f"\nGENERAL DESCRIPTION AND HISTORY:", file=out)
+        print(f"   - Business: {analysis.business_description}", file=out)
+        print(f"   - Evolution: {analysis.company_history}", file=out)
         
-        print(f"\nLEADERSHIP AND MANAGEMENT:")
+        print(f"\nLEADERSHIP AND MANAGEMENT:", file=out)
         for exec in analysis.key_executives:
-            print(f"   - {exec['title']}: {exec['name']} (Ownership: {exec['ownership']}%)")
-        print(f"   - Insights: {analysis.management_insights}")
+            print(f"   - {exec['title']}: {exec['name']} (Ownership: {exec['ownership']}%)", file=out)
+        print(f"   - Insights: {analysis.management_insights}", file=out)
         
-        print(f"\nMAJOR SHAREHOLDERS:")
+        print(f"\nMAJOR SHAREHOLDERS:", file=out)
         for title, ownership in analysis.major_shareholders.items():
-            print(f"   - {title}: {ownership}%")
+            print(f"   - {title}: {ownership}%", file=out)
         
-        print(f"\nCOMPETITION:")
+        print(f"\nCOMPETITION:", file=out)
         for comp in analysis.competitors:
-            print(f"   - {comp['name']} [{comp['ticker']}]: {comp['overlap']}")
+            print(f"   - {comp['name']} [{comp['ticker']}]: {comp['overlap']}", file=out)
         
-        print(f"\nSTRATEGY AND PRODUCTS:")
-        print(f"   - Revenue Model: {analysis.revenue_model}")
-        print(f"   - Core Strategy: {analysis.strategy}")
+        print(f"\nSTRATEGY AND PRODUCTS:", file=out)
+        print(f"   - Revenue Model: {analysis.revenue_model}", file=out)
+        print(f"   - Core Strategy: {analysis.strategy}", file=out)
         for title, description in analysis.products_services.items():
-            print(f"   - {title}: {description}")
+            print(f"   - {title}: {description}", file=out)
         
-        print(f"\nCOMPETITIVE ADVANTAGE (MOAT):")
-        print(f"   - {analysis.competitive_advantage}")
+        print(f"\nCOMPETITIVE ADVANTAGE (MOAT):", file=out)
+        print(f"   - {analysis.competitive_advantage}", file=out)
         
-        print(f"\nRISK FACTORS:")
+        print(f"\nRISK FACTORS:", file=out)
         for title, description in analysis.risk_factors.items():
-            print(f"   - {title}: {description}")
+            print(f"   - {title}: {description}", file=out)
             
-        print(f"\nRESILIENCE:")
-        print(f"   - Crisis History: {analysis.historical_context_crises}")
+        print(f"\nRESILIENCE:", file=out)
+        print(f"   - Crisis History: {analysis.historical_context_crises}", file=out)
         
-        print(f"\n{'='*60}\n")
\ No newline at end of file
+        print(f"\n{_REPORT_SEP}\n", file=out)
\ No newline at end of file
@@ -1,6 +1,12 @@
+import io
+import sys
 from application.use_cases.analyse_quantitative_valuation import QuantitativeValuationUseCase
 from application.dtos import QuantitativeValuationResult
 
+_REPORT_SEP = "=" * 50
+_METRIC_SEP = "-" * 40
+_COLHDR = f"{'Date':<15} | {'Value':>20}"
+
 class QuantitativeValuationAdapter:
     """
     Controller responsible for orchestrating the stock quantitative valuation process performing analysis using the QuantitativeValuationUseCase.
@@ -23,45 +29,66 @@ class QuantitativeValuationAdapter:
             years (int): The number of recent years to include in the analysis.
             
         Returns:
-            None: This method creates the QuantitativeValuationResult.
+            None: This method prints the rendered report to the console.
+        """
+        sys.stdout.write(await self.render(ticker_symbol, years))
+        sys.stdout.flush()
+
+    async def render(self, ticker_symbol: str, years: int = 10) -> str:
+        """
+        Runs the quantitative valuation and returns the formatted report without printing it.
+        
+        Args:
+            ticker_symbol (str): The stock ticker symbol to analyse.
+            years (int): The number of recent years to include in the analysis.
+            
+        Returns:
+            str: The report text, or the error message if the valuation failed.
         """
+        out = io.StringIO()
         try:
             dto = await self.service.evaluate_ticker(ticker_symbol, years)
 
-            self._display_results(dto)
+            self._display_results(dto, out)
 
         except Exception as e:
-            print(f"Error: {e}")
+            return f"Error: {e}\n"
+        
+        return out.getvalue()
 
-    def _display_results(self, result: QuantitativeValuationResult):
+    def _display_results(self, result: QuantitativeValuationResult, out: io.StringIO):
         """
-        Nicely formats and prints the quantitative valuation results to the console.
+        Nicely formats the quantitative valuation results into the report buffer.
         
         Args:
             result (QuantitativeValuationResult): The result of the quantitative valuation analysis to display.
+            out (io.StringIO): The report buffer the results are written to.
             
         Returns:
-            None: This method prints the results directly to the console.
+            None: This method writes the results into the buffer.
         """
-        print(f"\n{'='*50}")
-        print(f"REPORT: {result.ticker.name} ({result.ticker.symbol})")
-        print(f"Sector: {result.ticker.sector} | Industry: {result.ticker.industry}")
-        print(f"{'='*50}")
+        print(f"\n{_REPORT_SEP}", file=out)
+        print(f"REPORT: {result.ticker.name} ({result.ticker.symbol})", file=out)
+        print(f"Sector: {result.ticker.sector} | Industry: {result.ticker.industry}", file=out)
+        print(_REPORT_SEP, file=out)
 
         for analysis in result.metrics.values():
-            print(f"\nMetric: {analysis.metric_name}")
-            print(f"{'Date':<15} | {'Value':>20}")
-            print("-" * 40)
+            yearly = analysis.yearly_data
+            n = len(yearly)
+            cagr = analysis.cagr
+
+            print(f"\nMetric: {analysis.metric_name}", file=out)
+            print(_COLHDR, file=out)
+            print(_METRIC_SEP, file=out)
             
-            for data_point in analysis.yearly_data:
-                formatted_value = f"{data_point.value:,.2f}"
-                print(f"{data_point.date:<15} | {formatted_value:>20}")
+            for data_point in yearly:
+                print(f"{data_point.date:<15} | {data_point.value:>20,.2f}", file=out)
                 
-            if analysis.cagr is not None:
-                print(f"\nCAGR ({len(analysis.yearly_data)-1} years): {analysis.cagr:>8.2f}%")
+            if cagr is not None:
+                print(f"\nCAGR ({n-1} years): {cagr:>8.2f}%", file=out)
             else:
-                print(f"\nCAGR: N/A (Insufficient data or zero initial value)")
+                print(f"\nCAGR: N/A (Insufficient data or zero initial value)", file=out)
             
-            print("-" * 40)
+            print(_METRIC_SEP, file=out)
         
-        print(f"\n{'='*50}\n")
\ No newline at end of file
+        print(f"\n{_REPORT_SEP}\n", file=out)
\ No newline at end of file
@@ -1,6 +1,10 @@
+import io
+import sys
 from application.use_cases.analyse_sector_industrial_valuation import SectorIndustrialValuationUseCase
 from application.dtos import SectorIndustrialValuationResult
 
+_REPORT_SEP = "=" * 75
+
 class SectorValuationAdapter:
     """
     Controller responsible for orchestrating the industry and sector valuation process.
@@ -23,45 +27,62 @@ class SectorValuationAdapter:
             ticker_symbol (str): The stock ticker used to identify the industry.
             
         Returns:
-            None: This method creates the SectorIndustrialValuationResult.
+            None: This method prints the rendered report to the console.
+        """
+        sys.stdout.write(await self.render(ticker_symbol))
+        sys.stdout.flush()
+
+    async def render(self, ticker_symbol: str) -> str:
+        """
+        Runs the industry analysis and returns the formatted report without printing it.
+
+        Args:
+            ticker_symbol (str): The stock ticker used to identify the industry.
+            
+        Returns:
+            str: The report text, or the error message if the analysis failed.
         """
-        print(f"\nPerforming Industry Dynamics Analysis for {ticker_symbol}...")
+        header = f"\nPerforming Industry Dynamics Analysis for {ticker_symbol}...\n"
         
         try:
             analysis_dto = await self.service.evaluate_industry_by_ticker(ticker_symbol)
-            self._display_industry_report(analysis_dto)
+            out = io.StringIO()
+            self._display_industry_report(analysis_dto, out)
 
         except Exception as e:
-            print(f"Industry analysis error: {e}")
+            return f"{header}Industry analysis error: {e}\n"
+        
+        return header + out.getvalue()
 
-    def _display_industry_report(self, analysis: SectorIndustrialValuationResult):
+    def _display_industry_report(self, analysis: SectorIndustrialValuationResult, out: io.StringIO):
         """
-        Formats and prints the structural industry analysis to the console.
+        Formats the structural industry analysis into the report buffer.
         
         Args:
             analysis (SectorIndustrialValuationResult): The industry/sector valuation analysis to display.
+            out (io.StringIO): The report buffer the analysis is written to.
             
         Returns:
-            None: This method prints the results directly to the console.
+            None: This method writes the results into the buffer.
         """
-        print(f"\n{'='*75}")
-        print(f"INDUSTRY STRUCTURAL ANALYSIS: {analysis.industry.upper()}")
-        print(f"Sector: {analysis.sector} | Reference Ticker: {analysis.ticker.symbol}")
-        print(f"{'='*75}")
+        print(f"\n{_REPORT_SEP}", file=out)
+        print(f"INDUSTRY STRUCTURAL ANALYSIS: {analysis.industry.upper()}", file=out)
+        print(f"Sector: {analysis.sector} | Reference Ticker: {analysis.ticker.symbol}", file=out)
+        print(_REPORT_SEP, file=out)
         
-        self._print_force_section("RIVALRY AMONG COMPETITORS", analysis.rivalry_among_competitors)
-        self._print_force_section("BARGAINING POWER OF SUPPLIERS", analysis.bargaining_power_of_suppliers)
-        self._print_force_section("BARGAINING POWER OF CUSTOMERS", analysis.bargaining_power_of_customers)
-        self._print_force_section("THREAT OF NEW ENTRANTS", analysis.threat_of_new_entrants)
-        self._print_force_section("THREAT OF OBSOLESCENCE", analysis.threat_of_obsolescence)
+        self._print_force_section("RIVALRY AMONG COMPETITORS", analysis.rivalry_among_competitors, out)
+        self._print_force_section("BARGAINING POWER OF SUPPLIERS", analysis.bargaining_power_of_suppliers, out)
+        self._print_force_section("BARGAINING POWER OF CUSTOMERS", analysis.bargaining_power_of_customers, out)
+        self._print_force_section("THREAT OF NEW ENTRANTS", analysis.threat_of_new_entrants, out)
+        self._print_force_section("THREAT OF OBSOLESCENCE", analysis.threat_of_obsolescence, out)
         
-        print(f"\nMACROECONOMIC SENSITIVITY:")
-        print(f"   - Economic Sensitivity: {analysis.economic_sensitivity}")
-        print(f"   - Interest Rate Exposure: {analysis.interest_rate_exposure}")
+        print(f"\nMACROECONOMIC SENSITIVITY:", file=out)
+        print(f"   - Economic Sensitivity: {analysis.economic_sensitivity}", file=out)
+        print(f"   - Interest Rate Exposure: {analysis.interest_rate_exposure}", file=out)
         
-        print(f"\n{'='*75}\n")
+        print(f"\n{_REPORT_SEP}\n", file=out)
 
-    def _print_force_section(self, title: str, force_dict: dict):
+    def _print_force_section(self, title: str, force_dict: dict, out: io.StringIO):
         """
         Helper to print dictionary-based analysis sections in a bulleted list format.
         
@@ -69,10 +90,11 @@ class SectorValuationAdapter:
             title (str): The name of the industry force or section.
             force_dict (dict): A dictionary where keys are factors and values are 
                                their corresponding qualitative descriptions.
+            out (io.StringIO): The report buffer the section is written to.
                                
         Returns:
             None: Only helps to print the keys and values of the dict
         """
-        print(f"\n{title}:")
+        print(f"\n{title}:", file=out)
         for factor, description in force_dict.items():
-            print(f"   - {factor}: {description}")
\ No newline at end of file
+            print(f"   - {factor}: {description}", file=out)
\ No newline at end of file
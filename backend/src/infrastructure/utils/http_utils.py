@@ -0,0 +1,74 @@
+import asyncio
+import httpx
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar('T')
+
+class LoopBound(Generic[T]):
+    """
+    Holds an object that may only be used from the event loop it was created in.
+
+    Connection pools, semaphores and locks are tied to the loop they were first used in, so one kept
+    across asyncio.run calls (CLI runs, test suites) fails with "Event loop is closed" or "bound to a
+    different event loop". The object is therefore rebuilt whenever the running loop changes, while
+    calls within one loop keep reusing the same instance.
+    """
+    def __init__(self, factory: Callable[[], T]):
+        """
+        Initializes the holder without building anything.
+
+        Args:
+            factory (Callable[[], T]): Builds a new object on demand.
+        """
+        self._factory = factory
+        self._value: Optional[T] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _is_stale(self, value: T) -> bool:
+        """Whether the held object can no longer be used even on its own loop."""
+        return False
+
+    def get(self) -> T:
+        """
+        Returns the object for the running event loop, creating it on first use in that loop.
+
+        Returns:
+            T: The object bound to the current loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._value is None or self._loop is not loop or self._is_stale(self._value):
+            # An object left over from another loop cannot be cleaned up from this one; its resources
+            # were released when that loop was torn down, so it is simply dropped.
+            self._value = self._factory()
+            self._loop = loop
+        return self._value
+
+    def release(self) -> Optional[T]:
+        """
+        Empties the holder and hands back the object if it belongs to the running event loop.
+
+        Returns:
+            Optional[T]: The object to clean up, or None if there is none for this loop.
+        """
+        value, loop = self._value, self._loop
+        self._value = self._loop = None
+        return value if loop is asyncio.get_running_loop() else None
+
+class LoopBoundAsyncClient(LoopBound[httpx.AsyncClient]):
+    """
+    Holds a pooled httpx.AsyncClient for the event loop it runs on.
+
+    An AsyncClient's connection pool is tied to the loop it was first used in, so the client is rebuilt
+    whenever the running loop changes (or after it was closed), while calls within one loop keep reusing
+    warm connections.
+    """
+    def _is_stale(self, value: httpx.AsyncClient) -> bool:
+        return value.is_closed
+
+    async def aclose(self):
+        """
+        Closes the client if it belongs to the running event loop.
+        """
+        client = self.release()
+        if client is not None and not client.is_closed:
+            await client.aclose()
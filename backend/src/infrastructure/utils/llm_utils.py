@@ -1,4 +1,5 @@
 import json_repair
+import orjson
 from application.exceptions.exceptions import LLMParsingError
 
 def extract_json_from_response(text: str) -> dict:
@@ -21,6 +22,14 @@ def extract_json_from_response(text: str) -> dict:
     else:
         raise LLMParsingError("No JSON object found in response.")
     
+    try:
+        # Fast path: well-formed JSON (the common case with JSON mode) parses directly in orjson
+        parsed = orjson.loads(text)
+        if isinstance(parsed, (dict, list)):
+            return parsed
+    except orjson.JSONDecodeError:
+        pass
+    
     try:
         # Use json_repair to robustly handle LLM hallucinations like trailing commas or extra braces
         repaired_json = json_repair.loads(text)
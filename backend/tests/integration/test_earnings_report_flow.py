@@ -23,12 +23,14 @@ class TestEarningsIntegrationFlow:
         async def side_effect(url, params, **kwargs):
             mock_response = mocker.MagicMock()
             if params.get("function") == "OVERVIEW":
-                mock_response.json.return_value = {
+                mock_response.content = json.dumps({
                     "Symbol": "MSFT", 
                     "Name": "Microsoft Corporation", 
                     "Sector": "TECHNOLOGY", 
                     "Industry": "SOFTWARE"
-                }
+                }).encode()
+            else:
+                mock_response.content = b"{}"
             mock_response.raise_for_status.return_value = None
             return mock_response
 
@@ -20,12 +20,14 @@ class TestQualitativeIntegrationFlow:
         async def side_effect(url, params, **kwargs):
             mock_response = mocker.MagicMock()
             if params.get("function") == "OVERVIEW":
-                mock_response.json.return_value = {
+                mock_response.content = json.dumps({
                     "Symbol": "MSFT", 
                     "Name": "Microsoft Corporation", 
                     "Sector": "TECHNOLOGY", 
                     "Industry": "SOFTWARE"
-                }
+                }).encode()
+            else:
+                mock_response.content = b"{}"
             mock_response.raise_for_status.return_value = None
             return mock_response
 
@@ -56,7 +58,9 @@ class TestQualitativeIntegrationFlow:
             "moat_trajectory_status": "EXPANDING",
             "moat_trajectory_description": "Strong pricing power.",
             "moat_sources": {"intangible_assets": 4, "switching_costs": 5, "network_effect": 5, "cost_advantage": 3, "efficient_scale": 2},
-            "quality_pillars": {"management_quality": 4, "business_model_resilience": 5, "pricing_power": 4, "innovation_and_growth": 4, "tam_expansion": 4}
+            "quality_pillars": {"management_quality": 4, "business_model_resilience": 5, "pricing_power": 4, "innovation_and_growth": 4, "tam_expansion": 4},
+            "capital_allocation_strategy": "Buybacks and dividends funded by cloud cash flows",
+            "near_term_catalysts": [{"event": "Copilot monetisation", "impact": "Positive"}]
         }
         mock_response.text = json.dumps(json_ficticio)
         return client
@@ -1,3 +1,4 @@
+import json
 import pytest
 from decimal import Decimal
 
@@ -19,21 +20,21 @@ class TestQuantitativeIntegrationFlow:
             mock_response = mocker.MagicMock()
             
             if params.get("function") == "OVERVIEW":
-                mock_response.json.return_value = {
+                mock_response.content = json.dumps({
                     "Symbol": "AAPL", 
                     "Name": "Apple Inc", 
                     "Sector": "TECHNOLOGY", 
                     "Industry": "CONSUMER ELECTRONICS"
-                }
+                }).encode()
             elif params.get("function") == "GLOBAL_QUOTE":
-                mock_response.json.return_value = {
+                mock_response.content = json.dumps({
                     "Global Quote": {
                         "01. symbol": "AAPL",
                         "05. price": "150.00"
                     }
-                }
+                }).encode()
             elif params.get("function") == "INCOME_STATEMENT":
-                mock_response.json.return_value = {
+                mock_response.content = json.dumps({
                     "annualReports": [{
                         "fiscalDateEnding": "2023-12-31",
                         "totalRevenue": "383285000000",
@@ -42,9 +43,9 @@ class TestQuantitativeIntegrationFlow:
                         "operatingIncome": "114301000000",
                         "netIncome": "96995000000"
                     }]
-                }
+                }).encode()
             elif params.get("function") == "BALANCE_SHEET":
-                mock_response.json.return_value = {
+                mock_response.content = json.dumps({
                     "annualReports": [{
                         "fiscalDateEnding": "2023-12-31",
                         "commonStockSharesOutstanding": "15550061000",
@@ -54,24 +55,25 @@ class TestQuantitativeIntegrationFlow:
                         "totalLiabilities": "290437000000",
                         "cashAndCashEquivalentsAtCarryingValue": "29965000000"
                     }]
-                }
+                }).encode()
             elif params.get("function") == "CASH_FLOW":
-                mock_response.json.return_value = {
+                mock_response.content = json.dumps({
                     "annualReports": [{
                         "fiscalDateEnding": "2023-12-31",
                         "operatingCashflow": "110543000000",
                         "capitalExpenditures": "10959000000"
                     }]
-                }
+                }).encode()
             elif params.get("function") == "TIME_SERIES_MONTHLY":
-                mock_response.json.return_value = {
+                mock_response.content = json.dumps({
                     "Monthly Time Series": {
                         "2023-12-29": {
                             "4. close": "150.00"
                         }
                     }
-                }
-                
+                }).encode()
+            else:
+                mock_response.content = b"{}"
             mock_response.raise_for_status.return_value = None
             return mock_response
 
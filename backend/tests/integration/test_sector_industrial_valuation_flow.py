@@ -20,12 +20,14 @@ class TestSectorIndustrialIntegrationFlow:
         async def side_effect(url, params, **kwargs):
             mock_response = mocker.MagicMock()
             if params.get("function") == "OVERVIEW":
-                mock_response.json.return_value = {
+                mock_response.content = json.dumps({
                     "Symbol": "NVDA", 
                     "Name": "NVIDIA Corporation", 
                     "Sector": "TECHNOLOGY", 
                     "Industry": "SEMICONDUCTORS"
-                }
+                }).encode()
+            else:
+                mock_response.content = b"{}"
             mock_response.raise_for_status.return_value = None
             return mock_response
 
@@ -1,5 +1,6 @@
 import pytest
 from decimal import Decimal
+from unittest.mock import ANY
 
 from application.use_cases.analyse_qualitative_valuation import QualitativeValuationUseCase
 from domain.entities import Ticker, CompanyProfile, MoatSources, QualityPillars
@@ -18,6 +19,7 @@ class TestQualitativeValuationUseCase:
         mock = mocker.MagicMock()
         mock.get_ticker_info = mocker.AsyncMock()
         mock.get_major_shareholders = mocker.AsyncMock()
+        mock.get_stock_fundamental_data = mocker.AsyncMock(return_value=[])
         return mock
 
     @pytest.fixture
@@ -66,7 +68,6 @@ class TestQualitativeValuationUseCase:
         assert result.key_executives[0]["name"] == "Satya Nadella"
         
         mock_quant_adapter.get_ticker_info.assert_called_once_with("MSFT")
-        from unittest.mock import ANY
         mock_qual_adapter.analyse_company.assert_called_once_with(symbol="MSFT", language="en", context=ANY)
 
     @pytest.mark.anyio
@@ -74,4 +75,48 @@ class TestQualitativeValuationUseCase:
         mock_quant_adapter.get_ticker_info.side_effect = ConnectionError("API Limit")
 
         with pytest.raises(ConnectionError, match="API Limit"):
-            await use_case.analyse_ticker("MSFT")
\ No newline at end of file
+            await use_case.analyse_ticker("MSFT")
+
+    @pytest.mark.anyio
+    async def test_analyse_tickers_preserves_order(self, use_case, mocker):
+        async def fake_analyse(symbol, language="en", period=None):
+            return symbol
+
+        mocker.patch.object(use_case, "analyse_ticker", side_effect=fake_analyse)
+
+        result = await use_case.analyse_tickers(["MSFT", "AAPL", "GOOG"])
+
+        assert result == ["MSFT", "AAPL", "GOOG"]
+
+    @pytest.mark.anyio
+    async def test_analyse_ticker_reuses_cached_result(self, use_case, mocker):
+        sentinel = object()
+        analyse = mocker.patch.object(use_case, "_analyse_ticker", mocker.AsyncMock(return_value=sentinel))
+
+        first = await use_case.analyse_ticker("msft")
+        second = await use_case.analyse_ticker("MSFT")
+        other_language = await use_case.analyse_ticker("MSFT", language="es")
+
+        assert first is second is other_language is sentinel
+        assert analyse.await_count == 2
+
+    @pytest.mark.anyio
+    async def test_analyse_ticker_cache_expires(self, use_case, mocker):
+        use_case.RESULT_CACHE_TTL = 0
+        analyse = mocker.patch.object(use_case, "_analyse_ticker", mocker.AsyncMock(return_value=object()))
+
+        await use_case.analyse_ticker("MSFT")
+        await use_case.analyse_ticker("MSFT")
+
+        assert analyse.await_count == 2
+        assert list(use_case._results) == [("MSFT", "en", None)]
+
+    @pytest.mark.anyio
+    async def test_analyse_ticker_cache_is_bounded(self, use_case, mocker):
+        use_case.RESULT_CACHE_SIZE = 2
+        mocker.patch.object(use_case, "_analyse_ticker", mocker.AsyncMock(return_value=object()))
+
+        for symbol in ("MSFT", "AAPL", "GOOG"):
+            await use_case.analyse_ticker(symbol)
+
+        assert [key[0] for key in use_case._results] == ["AAPL", "GOOG"]
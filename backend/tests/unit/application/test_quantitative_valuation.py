@@ -1,10 +1,24 @@
 import pytest
 from decimal import Decimal
 
-from application.use_cases.analyse_quantitative_valuation import QuantitativeValuationUseCase
-from domain.entities import Ticker, FinancialYear
+import numpy as np
+
+from application.use_cases.analyse_quantitative_valuation import QuantitativeValuationUseCase, cagr_batch, cagr_to_decimal
+from domain.entities import Ticker, FinancialYear, Price
 from application.dtos import QuantitativeValuationResult
 
+def _make_year(date):
+    """Builds a FinancialYear with 100 revenue, 10 shares and 100 assets; every other reported line is zero."""
+    zero = Decimal("0")
+    return FinancialYear(
+        fiscal_date_ending=date, revenue=Decimal("100"), ebitda=zero, gross_profit=zero,
+        operating_income=zero, net_income=zero, operating_cash_flow=zero, capital_expenditures=zero,
+        shares_outstanding=Decimal("10"), short_term_debt=zero, long_term_debt=zero, total_debt=zero,
+        total_assets=Decimal("100"), total_liabilities=zero, cash_and_equivalents=zero,
+        accounts_payable=zero, current_liabilities=zero, accounts_receivable=zero, inventory=zero,
+        current_assets=zero, net_ppe=zero, intangible_assets=zero
+    )
+
 class TestQuantitativeValuationUseCase:
 
     @pytest.fixture
@@ -26,7 +40,6 @@ class TestQuantitativeValuationUseCase:
             symbol="AAPL", name="Apple", sector="Tech", industry="Hardware"
         )
         
-        from domain.entities import Price
         mock_quant_adapter.get_stock_current_price.return_value = Price(amount=Decimal("150.0"), currency="USD")
 
         fy_recent = FinancialYear(
@@ -65,11 +78,90 @@ class TestQuantitativeValuationUseCase:
         mock_quant_adapter.get_ticker_info.assert_called_once_with("AAPL")
         mock_quant_adapter.get_stock_fundamental_data.assert_called_once_with("AAPL")
         
+    @pytest.mark.anyio
+    async def test_evaluate_ticker_selects_most_recent_years_with_ttm_first(self, use_case, mock_quant_adapter):
+        mock_quant_adapter.get_ticker_info.return_value = Ticker(
+            symbol="AAPL", name="Apple", sector="Tech", industry="Hardware"
+        )
+        mock_quant_adapter.get_stock_current_price.return_value = Price(amount=Decimal("150.0"), currency="USD")
+        mock_quant_adapter.get_stock_quarterly_data.return_value = []
+
+        provider_years = [_make_year(f"{y}-12-31") for y in range(2015, 2024)] + [_make_year("TTM")]
+        mock_quant_adapter.get_stock_fundamental_data.return_value = provider_years
+
+        result = await use_case.evaluate_ticker("AAPL", years=3)
+
+        dates = [y.date for y in result.metrics["revenue"].yearly_data]
+        assert dates == ["TTM", "2023-12-31", "2022-12-31"]
+        assert result.metrics["market_cap"].yearly_data[0].value == Decimal("1500.0")
+        assert provider_years[-1].year_end_price == Decimal("0")
+
+    @pytest.mark.anyio
+    async def test_evaluate_ticker_keeps_dates_for_unreported_metrics(self, use_case, mock_quant_adapter):
+        mock_quant_adapter.get_ticker_info.return_value = Ticker(
+            symbol="AAPL", name="Apple", sector="Tech", industry="Hardware"
+        )
+        mock_quant_adapter.get_stock_current_price.return_value = Price(amount=Decimal("150.0"), currency="USD")
+        mock_quant_adapter.get_stock_quarterly_data.return_value = []
+
+        mock_quant_adapter.get_stock_fundamental_data.return_value = [_make_year("2023-12-31"), _make_year("2022-12-31")]
+
+        result = await use_case.evaluate_ticker("AAPL", years=2)
+
+        for metric in ("interest_expense", "dividends_paid"):
+            analysis = result.metrics[metric]
+            assert [(y.date, y.value) for y in analysis.yearly_data] == [("2023-12-31", None), ("2022-12-31", None)]
+            assert analysis.cagr is None
+        assert result.metrics["interest_expense"].yearly_data is not result.metrics["dividends_paid"].yearly_data
+        assert [y.value for y in result.metrics["revenue"].yearly_data] == [Decimal("100"), Decimal("100")]
+
+    @pytest.mark.anyio
+    async def test_evaluate_ticker_reuses_analysis_for_unchanged_periods(self, use_case, mock_quant_adapter, mocker):
+        mock_quant_adapter.get_ticker_info.return_value = Ticker(
+            symbol="AAPL", name="Apple", sector="Tech", industry="Hardware"
+        )
+        mock_quant_adapter.get_stock_current_price.return_value = Price(amount=Decimal("150.0"), currency="USD")
+        mock_quant_adapter.get_stock_quarterly_data.return_value = []
+
+        mock_quant_adapter.get_stock_fundamental_data.return_value = [_make_year("TTM"), _make_year("2023-12-31")]
+        spy = mocker.spy(use_case, "_analyse_metrics")
+
+        first = await use_case.evaluate_ticker("AAPL", years=2)
+        second = await use_case.evaluate_ticker("AAPL", years=2)
+        assert spy.call_count == 1
+        assert second.metrics == first.metrics
+
+        # A new price changes the TTM period, so the analysis is recomputed
+        mock_quant_adapter.get_stock_current_price.return_value = Price(amount=Decimal("160.0"), currency="USD")
+        third = await use_case.evaluate_ticker("AAPL", years=2)
+        assert spy.call_count == 2
+        assert third.metrics["market_cap"].yearly_data[0].value == Decimal("1600.0")
+
+    @pytest.mark.anyio
+    async def test_evaluate_tickers_preserves_order(self, use_case, mocker):
+        async def fake_evaluate(symbol, years=5):
+            return symbol
+
+        mocker.patch.object(use_case, "evaluate_ticker", side_effect=fake_evaluate)
+
+        result = await use_case.evaluate_tickers(["MSFT", "AAPL", "GOOG"])
+
+        assert result == ["MSFT", "AAPL", "GOOG"]
+
     def test_calculate_cagr_happy_path(self):
         values = [Decimal("121"), Decimal("110"), Decimal("100")]
         cagr = QuantitativeValuationUseCase.calculate_cagr(values)
         assert cagr == Decimal("10.00")
 
+    @pytest.mark.parametrize("recent_val, expected", [
+        (Decimal("100.125"), Decimal("0.12")),
+        (Decimal("100.135"), Decimal("0.14")),
+    ])
+    def test_calculate_cagr_rounds_half_even_in_decimal(self, recent_val, expected):
+        # Exact Decimal ties at the second decimal; binary floats land on either side of them
+        cagr = QuantitativeValuationUseCase.calculate_cagr([recent_val, Decimal("100")])
+        assert cagr == expected
+
     def test_cagr_returns_none_with_insufficient_data(self):
         values = [Decimal("100")]
         cagr = QuantitativeValuationUseCase.calculate_cagr(values)
@@ -83,4 +175,22 @@ class TestQuantitativeValuationUseCase:
     def test_cagr_returns_none_with_invalid_values(self, recent_val, old_val):
         values = [recent_val, Decimal("50"), old_val]
         cagr = QuantitativeValuationUseCase.calculate_cagr(values)
-        assert cagr is None
\ No newline at end of file
+        assert cagr is None
+
+    def test_cagr_batch_matches_calculate_cagr(self):
+        rows = [
+            [Decimal("121"), Decimal("110"), Decimal("100")],
+            [Decimal("-50"), Decimal("-80"), Decimal("-100")],
+            [Decimal("100"), Decimal("50"), Decimal("-50")],
+            [Decimal("100"), Decimal("50"), Decimal("0")],
+            [None, Decimal("50"), Decimal("100")],
+            [Decimal("0"), Decimal("50"), Decimal("100")],
+            [Decimal("100.125"), Decimal("100")],
+            [Decimal("100.135"), Decimal("100")],
+            [Decimal("99.875"), Decimal("100")],
+        ]
+
+        for row in rows:
+            values = np.array([[np.nan if v is None else float(v) for v in row]], dtype=np.float64)
+            cagr = cagr_batch(values)[0]
+            assert cagr_to_decimal(cagr, row) == QuantitativeValuationUseCase.calculate_cagr(row)
@@ -56,7 +56,9 @@ class TestSectorIndustrialValuationUseCase:
         mock_sector_port.analyse_industry.assert_called_once_with(
             sector="Consumer Cyclical",
             industry="Auto Manufacturers",
-            language="en"
+            language="en",
+            ticker="TSLA",
+            context=""
         )
 
     @pytest.mark.anyio
@@ -1,3 +1,7 @@
+import asyncio
+import json
+import os
+import time
 import pytest
 from application.exceptions.exceptions import ExternalServiceError
 from decimal import Decimal
@@ -27,12 +31,12 @@ class TestAlphaVantageAdapter:
     @pytest.mark.anyio
     async def test_get_ticker_info_happy_path(self, adapter, mock_session, mocker):
         mock_response = mocker.MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "Symbol": "MSFT",
             "Name": "Microsoft Corporation",
             "Sector": "TECHNOLOGY",
             "Industry": "SERVICES-PREPACKAGED SOFTWARE"
-        }
+        }).encode()
         mock_response.raise_for_status.return_value = None
         mock_session.get.return_value = mock_response
 
@@ -51,12 +55,12 @@ class TestAlphaVantageAdapter:
     @pytest.mark.anyio
     async def test_get_stock_current_price_happy_path(self, adapter, mock_session, mocker):
         mock_response = mocker.MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "Global Quote": {
                 "01. symbol": "MSFT",
                 "05. price": "415.50"
             }
-        }
+        }).encode()
         mock_response.raise_for_status.return_value = None
         mock_session.get.return_value = mock_response
         
@@ -69,7 +73,7 @@ class TestAlphaVantageAdapter:
     @pytest.mark.anyio
     async def test_get_historical_prices_happy_path(self, adapter, mock_session, mocker):
         mock_response = mocker.MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "Meta Data": {
                 "1. Information": "Monthly Prices (open, high, low, close) and Volumes",
                 "2. Symbol": "MSFT",
@@ -90,7 +94,7 @@ class TestAlphaVantageAdapter:
                     "5. volume": "654321987"
                 }
             }
-        }
+        }).encode()
         mock_response.raise_for_status.return_value = None
         mock_session.get.return_value = mock_response
         
@@ -127,9 +131,125 @@ class TestAlphaVantageAdapter:
     @pytest.mark.anyio
     async def test_get_data_handles_api_rate_limits_and_errors(self, adapter, mock_session, mocker, api_error_response, expected_match):
         mock_response = mocker.MagicMock()
-        mock_response.json.return_value = api_error_response
+        mock_response.content = json.dumps(api_error_response).encode()
         mock_response.raise_for_status.return_value = None
         mock_session.get.return_value = mock_response
         
         with pytest.raises(Exception, match=expected_match):
-            await adapter.get_ticker_info("MSFT")
\ No newline at end of file
+            await adapter.get_ticker_info("MSFT")
+
+    @pytest.mark.anyio
+    async def test_throttle_spaces_consecutive_network_calls(self, adapter, mocker):
+        sleep_mock = mocker.patch("infrastructure.adapters.output.alpha_vantage_adapter.asyncio.sleep", return_value=None)
+
+        await adapter._throttle()
+        sleep_mock.assert_not_called()
+
+        await adapter._throttle()
+        sleep_mock.assert_called_once()
+        waited = sleep_mock.call_args.args[0]
+        assert 0 < waited <= adapter.MIN_REQUEST_INTERVAL
+
+    def test_throttle_lock_is_rebuilt_for_a_new_event_loop(self, adapter, mocker):
+        async def yielding_sleep(delay):
+            loop = asyncio.get_running_loop()
+            done = loop.create_future()
+            loop.call_soon(done.set_result, None)
+            await done
+
+        mocker.patch("infrastructure.adapters.output.alpha_vantage_adapter.asyncio.sleep", side_effect=yielding_sleep)
+
+        async def throttle_batch():
+            await asyncio.gather(*(adapter._throttle() for _ in range(3)))
+
+        # The queued callers contend on the lock in both runs; a lock kept from the first loop would raise here
+        asyncio.run(throttle_batch())
+        asyncio.run(throttle_batch())
+
+    @pytest.mark.anyio
+    async def test_get_data_uses_per_function_cache_ttl(self, adapter, mock_session, mocker, tmp_path):
+        two_days_ago = time.time() - 2 * 86400
+        for function in ("INCOME_STATEMENT", "OVERVIEW"):
+            cache_path = tmp_path / f"{function}_MSFT.json"
+            cache_path.write_text(json.dumps({"cached": function}))
+            os.utime(cache_path, (two_days_ago, two_days_ago))
+
+        mock_response = mocker.MagicMock()
+        mock_response.content = json.dumps({"fresh": True}).encode()
+        mock_response.raise_for_status.return_value = None
+        mock_session.get.return_value = mock_response
+
+        assert await adapter._get_data("INCOME_STATEMENT", "MSFT") == {"cached": "INCOME_STATEMENT"}
+        mock_session.get.assert_not_called()
+
+        assert await adapter._get_data("OVERVIEW", "MSFT") == {"fresh": True}
+        mock_session.get.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_get_data_cache_hit_skips_rate_limiter(self, adapter, mock_session, mocker, tmp_path):
+        (tmp_path / "GLOBAL_QUOTE_MSFT.json").write_text(json.dumps({"Global Quote": {"05. price": "415.50"}}))
+        throttle = mocker.patch.object(adapter, "_throttle")
+
+        price = await adapter.get_stock_current_price("MSFT")
+
+        assert price.amount == Decimal("415.50")
+        throttle.assert_not_called()
+        mock_session.get.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_get_data_shares_concurrent_identical_requests(self, adapter, mock_session, mocker):
+        mock_response = mocker.MagicMock()
+        mock_response.content = json.dumps({"annualReports": []}).encode()
+        mock_response.raise_for_status.return_value = None
+        mock_session.get.return_value = mock_response
+
+        first, second = await asyncio.gather(
+            adapter._get_data("INCOME_STATEMENT", "MSFT"),
+            adapter._get_data("INCOME_STATEMENT", "msft")
+        )
+
+        assert first == second == {"annualReports": []}
+        mock_session.get.assert_called_once()
+        assert adapter._inflight == {}
+
+    @pytest.mark.anyio
+    async def test_get_stock_fundamental_data_memoises_mapped_years(self, adapter, mock_session, mocker):
+        report = {"fiscalDateEnding": "2023-06-30", "totalRevenue": "1000"}
+        payloads = {
+            "INCOME_STATEMENT": {"annualReports": [report]},
+            "BALANCE_SHEET": {"annualReports": [report]},
+            "CASH_FLOW": {"annualReports": [report]},
+            "TIME_SERIES_MONTHLY": {"Monthly Time Series": {}},
+        }
+
+        async def side_effect(url, params, **kwargs):
+            mock_response = mocker.MagicMock()
+            mock_response.content = json.dumps(payloads[params["function"]]).encode()
+            mock_response.raise_for_status.return_value = None
+            return mock_response
+
+        mock_session.get.side_effect = side_effect
+
+        first = await adapter.get_stock_fundamental_data("MSFT")
+        second = await adapter.get_stock_fundamental_data("MSFT")
+
+        assert first == second
+        assert first is not second
+        assert first[0].revenue == Decimal("1000")
+        assert mock_session.get.call_count == 4
+
+    @pytest.mark.anyio
+    async def test_mapped_reports_evict_expired_and_oldest_entries(self, adapter, mocker):
+        adapter.MAPPED_CACHE_SIZE = 2
+        mocker.patch.object(adapter, "_get_data", mocker.AsyncMock(return_value={}))
+        mocker.patch.object(adapter, "get_historical_prices", mocker.AsyncMock(return_value={}))
+        mapper = mocker.MagicMock(return_value=[])
+
+        for symbol in ("MSFT", "AAPL", "GOOG"):
+            await adapter._get_mapped_reports(symbol, "annualReports", mapper)
+        assert [key[0] for key in adapter._mapped_reports] == ["AAPL", "GOOG"]
+
+        adapter.DEFAULT_CACHE_TTL = 0
+        await adapter._get_mapped_reports("AMZN", "annualReports", mapper)
+
+        assert list(adapter._mapped_reports) == [("AMZN", "annualReports")]
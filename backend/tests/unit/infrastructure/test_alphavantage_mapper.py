@@ -2,7 +2,8 @@ import pytest
 from decimal import Decimal
 
 from domain.entities import Price, FinancialYear
-from infrastructure.mappers.alphavantage_mapper import parse_decimal, map_to_financial_years
+from infrastructure.mappers import alphavantage_mapper
+from infrastructure.mappers.alphavantage_mapper import parse_decimal, map_to_financial_years, warn_if_pure_python_decimal
 
 class TestParseDecimal:
     
@@ -84,4 +85,22 @@ class TestMapToFinancialYears:
         invalid_income = [{"totalRevenue": "1000"}] 
         years = map_to_financial_years(invalid_income, mock_balance, mock_cash, mock_prices)
         
-        assert len(years) == 0
\ No newline at end of file
+        assert len(years) == 0
+
+class TestDecimalBackendCheck:
+
+    def test_warns_when_running_on_pure_python_decimal(self, monkeypatch, caplog):
+        monkeypatch.setattr(alphavantage_mapper, "_C_DECIMAL", False)
+
+        with caplog.at_level("WARNING", logger="infrastructure.mappers.alphavantage_mapper"):
+            warn_if_pure_python_decimal()
+
+        assert "_pydecimal" in caplog.text
+
+    def test_is_silent_with_c_decimal(self, monkeypatch, caplog):
+        monkeypatch.setattr(alphavantage_mapper, "_C_DECIMAL", True)
+
+        with caplog.at_level("WARNING", logger="infrastructure.mappers.alphavantage_mapper"):
+            warn_if_pure_python_decimal()
+
+        assert caplog.text == ""
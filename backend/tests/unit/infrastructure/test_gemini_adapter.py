@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from application.exceptions.exceptions import ExternalServiceError
 import json
@@ -48,7 +49,9 @@ class TestGeminiAdapter:
             "moat_trajectory_status": "EXPANDING",
             "moat_trajectory_description": "Expanding",
             "moat_sources": {"intangible_assets": 4, "switching_costs": 5, "network_effect": 5, "cost_advantage": 3, "efficient_scale": 2},
-            "quality_pillars": {"management_quality": 4, "business_model_resilience": 5, "pricing_power": 4, "innovation_and_growth": 4, "tam_expansion": 4}
+            "quality_pillars": {"management_quality": 4, "business_model_resilience": 5, "pricing_power": 4, "innovation_and_growth": 4, "tam_expansion": 4},
+            "capital_allocation_strategy": "Buybacks and dividends funded by cloud cash flows",
+            "near_term_catalysts": [{"event": "Copilot monetisation", "impact": "Positive"}]
         }
         mock_response.text = json.dumps(json_ficticio)
 
@@ -155,4 +158,38 @@ class TestGeminiAdapter:
         with pytest.raises(ExternalServiceError, match="Gemini API Error"):
             await adapter.analyse_earnings_report("MSFT", "dummy_pdf.pdf")
             
-        assert mock_client.aio.models.generate_content.call_count == 1
\ No newline at end of file
+        assert mock_client.aio.models.generate_content.call_count == 1
+
+    def test_client_is_built_per_adapter_and_event_loop(self, mocker):
+        client_cls = mocker.patch("infrastructure.adapters.output.gemini_adapter.genai.Client", side_effect=lambda **kwargs: mocker.MagicMock())
+        first_adapter = GeminiAdapter(api_key="key")
+        second_adapter = GeminiAdapter(api_key="key")
+
+        async def get_clients():
+            return first_adapter.client, first_adapter.client, second_adapter.client
+
+        first, same, other = asyncio.run(get_clients())
+        rebuilt, _, _ = asyncio.run(get_clients())
+
+        assert first is same
+        assert first is not other
+        assert rebuilt is not first
+        assert client_cls.call_count == 4
+
+    def test_request_slots_are_rebuilt_for_a_new_event_loop(self, adapter, mock_client, mocker):
+        async def slow_generate(**kwargs):
+            await asyncio.sleep(0)
+            return mocker.MagicMock(text="{}")
+
+        mock_client.aio.models.generate_content.side_effect = slow_generate
+
+        async def generate_batch():
+            slots = adapter._request_slots
+            await asyncio.gather(*(adapter._generate_dcf_assumptions("prompt", None) for _ in range(2 * adapter.MAX_CONCURRENT_REQUESTS)))
+            return slots
+
+        first = asyncio.run(generate_batch())
+        second = asyncio.run(generate_batch())
+
+        assert first is not second
+        assert mock_client.aio.models.generate_content.await_count == 4 * adapter.MAX_CONCURRENT_REQUESTS
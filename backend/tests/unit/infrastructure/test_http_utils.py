@@ -0,0 +1,26 @@
+import asyncio
+import httpx
+import pytest
+
+from infrastructure.utils.http_utils import LoopBoundAsyncClient
+
+@pytest.mark.anyio
+async def test_client_is_reused_within_a_loop():
+    holder = LoopBoundAsyncClient(httpx.AsyncClient)
+
+    client = holder.get()
+
+    assert holder.get() is client
+    await holder.aclose()
+    assert client.is_closed
+
+def test_client_is_rebuilt_for_a_new_loop():
+    holder = LoopBoundAsyncClient(httpx.AsyncClient)
+
+    async def get_client():
+        return holder.get()
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+
+    assert first is not second
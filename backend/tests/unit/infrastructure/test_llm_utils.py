@@ -0,0 +1,20 @@
+import pytest
+
+from application.exceptions.exceptions import LLMParsingError
+from infrastructure.utils.llm_utils import extract_json_from_response
+
+class TestExtractJsonFromResponse:
+
+    def test_parses_fenced_valid_json(self):
+        text = '```json\n{"sector": "Tech", "scores": [1, 2]}\n```'
+
+        assert extract_json_from_response(text) == {"sector": "Tech", "scores": [1, 2]}
+
+    def test_repairs_malformed_json(self):
+        text = 'Here you go: {"sector": "Tech", "scores": [1, 2,],}'
+
+        assert extract_json_from_response(text) == {"sector": "Tech", "scores": [1, 2]}
+
+    def test_raises_when_no_object_present(self):
+        with pytest.raises(LLMParsingError, match="No JSON object found"):
+            extract_json_from_response("no json here")
@@ -0,0 +1,107 @@
+import pytest
+import pandas as pd
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from infrastructure.adapters.output.yfinance_adapter import YfinanceAdapter
+from infrastructure.utils.http_utils import LoopBoundAsyncClient
+
+@pytest.fixture
+def adapter():
+    return YfinanceAdapter()
+
+@pytest.mark.anyio
+async def test_ticker_info_reuses_ticker_instance(adapter):
+    mock_ticker = MagicMock()
+    mock_ticker.info = {"symbol": "AAPL", "longName": "Apple Inc.", "sector": "Technology", "industry": "Consumer Electronics"}
+
+    with patch("infrastructure.adapters.output.yfinance_adapter.yf.Ticker", return_value=mock_ticker) as mock_cls:
+        first = await adapter.get_ticker_info("AAPL")
+        second = await adapter.get_ticker_info("aapl")
+
+    assert first.name == second.name == "Apple Inc."
+    mock_cls.assert_called_once_with("AAPL")
+
+@pytest.mark.anyio
+async def test_ticker_instance_expires_after_ttl(adapter):
+    adapter.TICKER_CACHE_TTL = 0
+    mock_ticker = MagicMock()
+    mock_ticker.info = {"symbol": "AAPL", "longName": "Apple Inc."}
+
+    with patch("infrastructure.adapters.output.yfinance_adapter.yf.Ticker", return_value=mock_ticker) as mock_cls:
+        await adapter.get_ticker_info("AAPL")
+        await adapter.get_ticker_info("AAPL")
+
+    assert mock_cls.call_count == 2
+
+@pytest.mark.anyio
+async def test_ticker_cache_evicts_expired_and_oldest_entries(adapter):
+    adapter.TICKER_CACHE_SIZE = 2
+
+    with patch("infrastructure.adapters.output.yfinance_adapter.yf.Ticker", side_effect=lambda symbol: MagicMock()):
+        for symbol in ("AAPL", "MSFT", "GOOG"):
+            await adapter._get_ticker(symbol)
+        assert list(adapter._tickers) == ["MSFT", "GOOG"]
+
+        adapter.TICKER_CACHE_TTL = 0
+        await adapter._get_ticker("AMZN")
+
+    assert list(adapter._tickers) == ["AMZN"]
+
+@pytest.mark.anyio
+async def test_ticker_info_refreshes_live_quote_after_quote_ttl(adapter):
+    adapter.QUOTE_CACHE_TTL = 0
+    stale, fresh = MagicMock(), MagicMock()
+    stale.info = {"symbol": "AAPL", "marketCap": 100}
+    fresh.info = {"symbol": "AAPL", "marketCap": 120}
+
+    with patch("infrastructure.adapters.output.yfinance_adapter.yf.Ticker", side_effect=[stale, fresh]):
+        first = await adapter.get_ticker_info("AAPL")
+        second = await adapter.get_ticker_info("AAPL")
+
+    assert (first.market_cap, second.market_cap) == (Decimal("100"), Decimal("120"))
+    # The statements keep coming from the cached instance
+    assert adapter._tickers["AAPL"][1] is stale
+
+def _statement(dates, rows):
+    return pd.DataFrame({pd.Timestamp(d): [float(v) for v in rows.values()] for d in dates}, index=list(rows.keys()))
+
+@pytest.mark.anyio
+async def test_fundamental_data_sorted_ascending_with_ttm_last(adapter):
+    annual = ["2024-09-30", "2023-09-30", "2022-09-30"]
+    quarters = ["2025-06-30", "2025-03-31", "2024-12-31", "2024-09-30"]
+    rows = {"Total Revenue": 100, "Net Income": 10}
+
+    mock_ticker = MagicMock()
+    mock_ticker.financials = _statement(annual, rows)
+    mock_ticker.balance_sheet = _statement(annual, {"Total Assets": 500})
+    mock_ticker.cashflow = _statement(annual, {"Operating Cash Flow": 20})
+    mock_ticker.quarterly_financials = _statement(quarters, rows)
+    mock_ticker.quarterly_balance_sheet = _statement(quarters, {"Total Assets": 500})
+    mock_ticker.quarterly_cashflow = _statement(quarters, {"Operating Cash Flow": 5})
+    mock_ticker.history.return_value = pd.DataFrame()
+
+    with patch("infrastructure.adapters.output.yfinance_adapter.yf.Ticker", return_value=mock_ticker):
+        result = await adapter.get_stock_fundamental_data("AAPL")
+
+    assert [y.fiscal_date_ending for y in result] == ["2022-09-30", "2023-09-30", "2024-09-30", "TTM"]
+    assert result[-1].revenue == Decimal("400.0")
+
+@pytest.mark.anyio
+async def test_search_tickers_reuses_pooled_client(adapter):
+    mock_response = MagicMock(status_code=200)
+    mock_response.json.return_value = {"quotes": [
+        {"quoteType": "EQUITY", "symbol": "AAPL", "shortname": "Apple Inc.", "exchDisp": "NASDAQ"},
+        {"quoteType": "ETF", "symbol": "QQQ", "shortname": "Invesco QQQ", "exchDisp": "NASDAQ"},
+    ]}
+    mock_client = MagicMock(is_closed=False)
+    mock_client.get = AsyncMock(return_value=mock_response)
+    client_factory = MagicMock(return_value=mock_client)
+    adapter._search_client = LoopBoundAsyncClient(client_factory)
+
+    first = await adapter.search_tickers("apple")
+    second = await adapter.search_tickers("appl")
+
+    assert first == second == [{"symbol": "AAPL", "name": "Apple Inc.", "exchange": "NASDAQ"}]
+    assert mock_client.get.await_count == 2
+    client_factory.assert_called_once()
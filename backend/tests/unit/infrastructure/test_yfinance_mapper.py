@@ -0,0 +1,47 @@
+import pytest
+import numpy as np
+import pandas as pd
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from infrastructure.mappers.yfinance_mapper import to_decimal, parse_financial_period
+
+class TestToDecimal:
+
+    @pytest.mark.parametrize("valid_input, expected_output", [
+        (np.float64(383285000000.0), Decimal("383285000000.0")),
+        (np.float64(0.1), Decimal("0.1")),
+        (np.int64(42), Decimal("42")),
+        (7, Decimal("7")),
+        (np.float32(2.5), Decimal("2.5")),
+        (pd.array([1.5], dtype="Float64")[0], Decimal("1.5")),
+    ])
+    def test_to_decimal_valid_inputs(self, valid_input, expected_output):
+        result = to_decimal(valid_input)
+
+        assert result == expected_output
+        assert isinstance(result, Decimal)
+
+    @pytest.mark.parametrize("missing_input", [
+        None,
+        float("nan"),
+        np.nan,
+        pd.NA,
+        pd.array([None], dtype="Float64")[0],
+    ])
+    def test_to_decimal_handles_missing_data_as_zero(self, missing_input):
+        assert to_decimal(missing_input) == Decimal("0")
+
+class TestParseFinancialPeriod:
+
+    def test_price_lookup_failure_is_logged_and_defaults_to_zero(self, caplog):
+        date = pd.Timestamp("2023-12-31")
+        financials = pd.DataFrame({date: [100.0]}, index=["Total Revenue"])
+        ticker = MagicMock()
+        ticker.history.side_effect = ConnectionError("network down")
+
+        with caplog.at_level("WARNING", logger="infrastructure.mappers.yfinance_mapper"):
+            year = parse_financial_period("2023-12-31", date, financials, pd.DataFrame(), pd.DataFrame(), ticker)
+
+        assert year.year_end_price == Decimal("0")
+        assert "Could not fetch period-end price for 2023-12-31: network down" in caplog.text